@@ -12,6 +12,19 @@ References:
 import math
 from typing import Dict, Tuple
 
+# Metric coefficient tables from the CVSS v3.1 specification (Table 10).
+# Built once at import: calculate_base_score runs per evaluation and per
+# row in analytics flows, and rebuilding five dict literals on every call
+# is pure interpreter overhead.
+_AV_VALS = {"N": 0.85, "A": 0.62, "L": 0.55, "P": 0.2}
+_AC_VALS = {"L": 0.77, "H": 0.44}
+_PR_VALS = {
+    "U": {"N": 0.85, "L": 0.62, "H": 0.27},
+    "C": {"N": 0.85, "L": 0.68, "H": 0.5},
+}
+_UI_VALS = {"N": 0.85, "R": 0.62}
+_IMPACT_VALS = {"N": 0.0, "L": 0.22, "H": 0.56}
+
 
 def round_up(value: float) -> float:
     """Round up a CVSS score to one decimal place."""
@@ -78,23 +91,14 @@ def calculate_base_score(metrics: Dict[str, str]) -> Tuple[float, str, str]:
     m.setdefault("I", "N")
     m.setdefault("A", "N")
 
-    av_vals = {"N": 0.85, "A": 0.62, "L": 0.55, "P": 0.2}
-    ac_vals = {"L": 0.77, "H": 0.44}
-    pr_vals = {
-        "U": {"N": 0.85, "L": 0.62, "H": 0.27},
-        "C": {"N": 0.85, "L": 0.68, "H": 0.5},
-    }
-    ui_vals = {"N": 0.85, "R": 0.62}
-    impact_vals = {"N": 0.0, "L": 0.22, "H": 0.56}
-
-    av = av_vals.get(m["AV"], 0.55)
-    ac = ac_vals.get(m["AC"], 0.44)
+    av = _AV_VALS.get(m["AV"], 0.55)
+    ac = _AC_VALS.get(m["AC"], 0.44)
     scope = m["S"] if m["S"] in ("U", "C") else "U"
-    pr = pr_vals[scope].get(m["PR"], 0.85)
-    ui = ui_vals.get(m["UI"], 0.85)
-    c = impact_vals.get(m["C"], 0.0)
-    i = impact_vals.get(m["I"], 0.0)
-    a = impact_vals.get(m["A"], 0.0)
+    pr = _PR_VALS[scope].get(m["PR"], 0.85)
+    ui = _UI_VALS.get(m["UI"], 0.85)
+    c = _IMPACT_VALS.get(m["C"], 0.0)
+    i = _IMPACT_VALS.get(m["I"], 0.0)
+    a = _IMPACT_VALS.get(m["A"], 0.0)
 
     exploitability = 8.22 * av * ac * pr * ui
     impact = 1 - (1 - c) * (1 - i) * (1 - a)
@@ -73,7 +73,33 @@ class DocumentProcessor:
                 'H': [r'\bhigh\s+availability\s+impact\b', r'\bcomplete\s+service\s+disruption\b', r'\bhigh\s+availability\b', r'\bcomplete\b', r'\bhigh\b', r'\bhigh\s+availability\b']
             }
         }
-    
+
+        # Priority order per metric: for C/I/A prefer High over Low over None,
+        # elsewhere prefer the more specific wording first.
+        self.priority_order = {
+            'AV': ('N', 'A', 'L', 'P'),
+            'AC': ('L', 'H'),
+            'PR': ('N', 'L', 'H'),
+            'UI': ('N', 'R'),
+            'S': ('U', 'C'),
+            'C': ('H', 'L', 'N'),
+            'I': ('H', 'L', 'N'),
+            'A': ('H', 'L', 'N'),
+        }
+
+        # Precompile one combined alternation per (metric, value).  A naive
+        # re.search per phrase rescans the document dozens of times; a single
+        # compiled pattern per value lets the regex engine make one pass over
+        # the text for all phrases of that value.
+        self.compiled_patterns = {
+            metric: [
+                (value, re.compile('|'.join(values[value]), re.IGNORECASE))
+                for value in self.priority_order[metric]
+                if value in values
+            ]
+            for metric, values in self.cvss_patterns.items()
+        }
+
     def extract_text_from_docx(self, file_content: bytes) -> str:
         """Extract text from Word document."""
         if not DEPENDENCIES_AVAILABLE:
@@ -128,33 +154,15 @@ class DocumentProcessor:
         """Detect CVSS metrics from text using pattern matching."""
         text_lower = text.lower()
         detected_metrics = {}
-        
-        # Debug: Print the text being analyzed
-        print(f"🔍 DEBUG - Analyzing text: {text_lower[:300]}...")
-        
-        # Detect each metric with priority (H > L > N)
-        for metric, values in self.cvss_patterns.items():
-            detected = False
-            
-            # Check patterns in priority order: High first, then Low, then None
-            priority_order = ['H', 'L', 'N'] if metric in ['C', 'I', 'A'] else ['N', 'A', 'L', 'P'] if metric == 'AV' else ['L', 'H'] if metric == 'AC' else ['N', 'L', 'H'] if metric == 'PR' else ['N', 'R'] if metric == 'UI' else ['U', 'C']
-            
-            for value in priority_order:
-                if value in values:
-                    patterns = values[value]
-                    for pattern in patterns:
-                        if re.search(pattern, text_lower, re.IGNORECASE):
-                            detected_metrics[metric] = value
-                            print(f"✅ {metric}: {value} (pattern: {pattern})")
-                            detected = True
-                            break
-                    if detected:
-                        break
-            
-            if not detected:
-                print(f"❌ {metric}: No pattern matched")
-        
-        print(f"🔍 DEBUG - Final metrics: {detected_metrics}")
+
+        # Detect each metric with priority (H > L > N), using the combined
+        # patterns compiled once at startup
+        for metric, alternatives in self.compiled_patterns.items():
+            for value, pattern in alternatives:
+                if pattern.search(text_lower):
+                    detected_metrics[metric] = value
+                    break
+
         return detected_metrics
     
     def extract_cve_id(self, text: str) -> Optional[str]:
@@ -206,3 +214,13 @@ class DocumentProcessor:
 
 # Global instance
 document_processor = DocumentProcessor()
+
+
+def process_document_bytes(file_content: bytes, filename: str) -> Dict[str, any]:
+    """Module-level wrapper around the shared processor.
+
+    concurrent.futures pickles submitted callables by qualified name, and
+    bound methods of the global instance do not survive that round trip,
+    so worker pools submit this function instead.
+    """
+    return document_processor.process_document(file_content, filename)
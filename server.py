@@ -45,41 +45,127 @@ demonstration purposes the server binds to all interfaces on
 port 8000.  Adjust ``HOST`` and ``PORT`` below to change that.
 """
 
+import concurrent.futures
+import email.parser
+import functools
+import gzip
 import http.server
 import json
+import logging
+import logging.handlers
+import operator
 import os
+import re
 import sqlite3
+import string
+import sys
+import threading
+import time
 import urllib.parse
 import tempfile
 import secrets
+import base64
 import hashlib
+import hmac
+from contextlib import contextmanager
+from queue import Empty, Full, Queue, SimpleQueue
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
 try:
     # When running as part of the cvss_server package (e.g., `python -m cvss_server.server`)
     from .cvss import calculate_base_score  # type: ignore
-    from .document_processor import document_processor  # type: ignore
 except ImportError:
     # Fallback to absolute import when executed as a script (`python cvss_server/server.py`)
-    import sys
-    from pathlib import Path
     # Add the parent directory of this file to sys.path
     current_path = Path(__file__).resolve()
     parent_dir = current_path.parent
     sys.path.append(str(parent_dir.parent))
     try:
         from cvss_server.cvss import calculate_base_score  # type: ignore
-        from cvss_server.document_processor import document_processor  # type: ignore
     except ImportError:
         # As a last resort, import from relative path by adjusting sys.path again
         sys.path.append(str(parent_dir))
         from cvss import calculate_base_score  # type: ignore
-        try:
-            from document_processor import document_processor  # type: ignore
-        except ImportError:
-            document_processor = None
+
+# orjson is an optional accelerator: its C serializer builds JSON payloads
+# several times faster than the stdlib and returns bytes directly.  The
+# server stays fully functional on the standard library alone.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# The document processor drags in python-docx/PyPDF2/pdfplumber, which only
+# the upload path needs.  A cheap file-presence flag answers "is the feature
+# available?" for render_form; the module itself is imported lazily (and
+# cached) the first time a document is actually processed.
+_DOC_PROCESSOR_AVAILABLE = (
+    Path(__file__).resolve().parent / "document_processor.py"
+).exists()
+
+
+@functools.cache
+def _get_document_processor():
+    """Import and return the shared document processor on first use.
+
+    Returns None when the module cannot be imported, mirroring the
+    behaviour of the previous eager import.
+    """
+    try:
+        from .document_processor import document_processor  # type: ignore
+        return document_processor
+    except ImportError:
+        pass
+    try:
+        from document_processor import document_processor  # type: ignore
+        return document_processor
+    except ImportError:
+        return None
+
+
+# docx/PDF parsing is CPU-bound and holds the GIL, so running it on a request
+# thread stalls every other connection while a large report is chewed through.
+# run_server() starts a small process pool up front; forking after the parser
+# libraries are imported means each worker arrives warm instead of paying the
+# python-docx/pdfplumber import cost on its first upload.
+_parse_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _start_parse_pool(max_workers: int = 2) -> None:
+    """Start the warm worker pool used for document parsing.
+
+    A no-op when the pool is already running or the document processor
+    is unavailable; in that case uploads are parsed inline.
+    """
+    global _parse_executor
+    if _parse_executor is None and _get_document_processor() is not None:
+        _parse_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        )
+
+
+def _process_document(file_content: bytes, filename: str) -> Dict[str, Any]:
+    """Parse an uploaded document, off the request thread when possible.
+
+    Submits to the process pool when one is running (see
+    :func:`_start_parse_pool`) and falls back to inline parsing
+    otherwise, e.g. when the module is used as a library or in tests.
+    """
+    processor = _get_document_processor()
+    if processor is None:
+        return {
+            'success': False,
+            'error': 'Document processing is not available',
+            'filename': filename,
+        }
+    if _parse_executor is not None:
+        wrapper = sys.modules[type(processor).__module__].process_document_bytes
+        return _parse_executor.submit(wrapper, file_content, filename).result(
+            timeout=30
+        )
+    return processor.process_document(file_content, filename)
 
 
 # ---------------------------------------------------------------------------
@@ -90,6 +176,22 @@ except ImportError:
 HOST = "0.0.0.0"
 PORT = 8000
 
+# Request logging goes through a queue to a background listener thread so
+# request threads never serialize on the stdout lock; the timestamp is
+# rendered lazily by the formatter instead of per-call datetime.isoformat.
+_log_queue: "SimpleQueue[logging.LogRecord]" = SimpleQueue()
+_log_formatter = logging.Formatter("[%(asctime)s] %(message)s")
+_log_formatter.converter = time.gmtime
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+
+logger = logging.getLogger("cvss")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
 # Path to the SQLite database file.  Stored relative to this script's
 # directory to avoid writing outside the repo.  If you change this
 # filename or location, existing data will not be migrated automatically.
@@ -99,6 +201,89 @@ DB_PATH = Path(__file__).resolve().parent / "database.db"
 # Database helpers
 # ---------------------------------------------------------------------------
 
+# Bounded pool of reusable SQLite connections.  Opening a fresh connection
+# per request (connect, read schema, teardown) is pure overhead under
+# ThreadingHTTPServer; a borrowed connection skips all of it.  Connections
+# are created lazily against DB_PATH, carry check_same_thread=False because
+# a connection may be borrowed from different request threads over its
+# lifetime (never concurrently), and run in WAL mode so readers are not
+# blocked by the occasional insert.
+_POOL_SIZE = 25
+_conn_pool: "Queue[sqlite3.Connection]" = Queue(maxsize=_POOL_SIZE)
+
+
+def _new_connection() -> sqlite3.Connection:
+    """Open a connection to DB_PATH with the shared pragmas applied.
+
+    WAL with synchronous=NORMAL drops the two per-commit fsyncs of
+    rollback journaling while staying durable up to the checkpoint
+    interval; temp_store and mmap_size keep sorts and page reads in
+    memory rather than on disk.
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA wal_autocheckpoint=1000;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+    return conn
+
+
+@contextmanager
+def get_conn():
+    """Borrow a pooled connection, returning it to the pool on exit.
+
+    A new connection is opened when the pool is empty; at most
+    ``_POOL_SIZE`` idle connections are retained, the rest are closed.
+    Any uncommitted state is rolled back before reuse so one request's
+    failure cannot leak into the next borrower.
+    """
+    try:
+        conn = _conn_pool.get_nowait()
+    except Empty:
+        conn = _new_connection()
+    try:
+        yield conn
+    finally:
+        try:
+            conn.rollback()
+            _conn_pool.put_nowait(conn)
+        except (sqlite3.Error, Full):
+            conn.close()
+
+
+def _reset_pool_for_tests() -> None:
+    """Close every pooled connection (used when DB_PATH is repointed)."""
+    while True:
+        try:
+            _conn_pool.get_nowait().close()
+        except Empty:
+            break
+
+
+# In-process ETag state for the read-only JSON endpoints.  The stored
+# evaluations only change through insert_evaluation, so a weak tag derived
+# from the last inserted row id is enough to answer "has anything changed?"
+# without touching the database on every poll.
+_ETAG_STATE: Dict[str, Optional[Tuple[int, str]]] = {"vulns": None}
+
+
+def _vulns_etag() -> str:
+    """Return a weak ETag that changes whenever an evaluation is inserted.
+
+    The tag is kept in process memory and bumped by insert_evaluation;
+    on a cold start it is seeded from MAX(id) in the database.
+    """
+    state = _ETAG_STATE["vulns"]
+    if state is None:
+        with get_conn() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM evaluations"
+            ).fetchone()
+        state = (row[0], f'W/"{row[0]}"')
+        _ETAG_STATE["vulns"] = state
+    return state[1]
+
 
 def init_db(db_path: Path) -> None:
     """Initialise the SQLite database if it does not already exist.
@@ -160,13 +345,42 @@ def init_db(db_path: Path) -> None:
             );
             """
         )
+
+        # Covering indexes for the dashboard severity counts.  With these,
+        # the GROUP BY in summary_counts_and_top becomes an index-only scan
+        # aggregated entirely inside SQLite's C loop instead of touching
+        # full table rows.
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_evaluations_severity"
+            " ON evaluations (severity);"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_evaluations_user_severity"
+            " ON evaluations (user_id, severity);"
+        )
+
+        # validate_session looks a token up on every authenticated request
+        # and the expiry sweep filters on expires_at; without indexes both
+        # are full table scans.  The composite evaluations index serves
+        # per-user listings ordered newest-first without a sort step.
+        cur.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_token"
+            " ON user_sessions (session_token);"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sessions_expires"
+            " ON user_sessions (expires_at);"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_evals_user_created"
+            " ON evaluations (user_id, created_at DESC);"
+        )
         conn.commit()
     finally:
         conn.close()
 
 
 def insert_evaluation(
-    db_path: Path,
     title: str,
     cve_id: str,
     source: str,
@@ -179,7 +393,6 @@ def insert_evaluation(
     """Insert a new evaluation record into the database.
 
     Args:
-        db_path: Path to the database file.
         title: Optional title or description of the vulnerability.
         cve_id: Optional CVE identifier.
         source: Optional source tag (e.g. "Internal" or "NVD").
@@ -193,8 +406,7 @@ def insert_evaluation(
     """
     created_at = datetime.utcnow().isoformat()
     metrics_json = json.dumps(metrics, sort_keys=True)
-    conn = sqlite3.connect(db_path)
-    try:
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute(
             """
@@ -215,138 +427,297 @@ def insert_evaluation(
             ),
         )
         conn.commit()
+        _ETAG_STATE["vulns"] = (cur.lastrowid, f'W/"{cur.lastrowid}"')
+        _SUMMARY_STATE["generation"] += 1
         return cur.lastrowid
-    finally:
-        conn.close()
 
 
-def fetch_evaluations(db_path: Path) -> List[Dict[str, Any]]:
+def insert_evaluations_bulk(
+    rows: List[Tuple[str, str, str, Dict[str, str], str, float, str]],
+    user_id: int = None,
+) -> List[int]:
+    """Insert many evaluation records inside one transaction.
+
+    A loop over insert_evaluation pays one commit (and its WAL frame
+    flush) per row; wrapping the batch in a single ``BEGIN IMMEDIATE``
+    ... ``COMMIT`` amortizes that cost across all rows.
+
+    Args:
+        rows: Sequence of (title, cve_id, source, metrics, vector,
+            base_score, severity) tuples, one per evaluation.
+        user_id: Optional id of the owning user, applied to every row.
+
+    Returns:
+        The integer IDs of the inserted rows, in input order.
+    """
+    created_at = datetime.utcnow().isoformat()
+    ids: List[int] = []
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("BEGIN IMMEDIATE;")
+        for title, cve_id, source, metrics, vector, base_score, severity in rows:
+            cur.execute(
+                """
+                INSERT INTO evaluations
+                    (title, cve_id, source, metrics_json, vector, base_score, severity, created_at, user_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    title or "",
+                    cve_id or "",
+                    source or "",
+                    json.dumps(metrics, sort_keys=True),
+                    vector,
+                    base_score,
+                    severity,
+                    created_at,
+                    user_id,
+                ),
+            )
+            ids.append(cur.lastrowid)
+        conn.commit()
+        if ids:
+            _ETAG_STATE["vulns"] = (ids[-1], f'W/"{ids[-1]}"')
+            _SUMMARY_STATE["generation"] += 1
+    return ids
+
+
+class Evaluation:
+    """Lightweight row object for the ``evaluations`` table.
+
+    ``sqlite3.Row`` resolves string keys with a linear column-name scan on
+    every access; with ten columns that adds up over large result sets.
+    ``__slots__`` makes attribute access a direct slot read, while
+    ``__getitem__``/``keys`` keep the object compatible with the dict-style
+    access used by the JSON and export paths.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "cve_id",
+        "source",
+        "metrics_json",
+        "vector",
+        "base_score",
+        "severity",
+        "created_at",
+        "user_id",
+    )
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _evaluation_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Evaluation:
+    """Row factory mapping a full evaluations row onto an Evaluation."""
+    e = Evaluation()
+    (
+        e.id,
+        e.title,
+        e.cve_id,
+        e.source,
+        e.metrics_json,
+        e.vector,
+        e.base_score,
+        e.severity,
+        e.created_at,
+        e.user_id,
+    ) = row
+    return e
+
+
+def fetch_evaluations() -> List[Evaluation]:
     """Fetch all evaluations from the database.
 
-    Returns a list of dictionaries with keys matching the database columns.
+    Returns a list of Evaluation row objects ordered newest first.
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    with get_conn() as conn:
         cur = conn.cursor()
+        cur.row_factory = _evaluation_factory
         cur.execute("SELECT * FROM evaluations ORDER BY created_at DESC")
-        rows = cur.fetchall()
-        evaluations: List[Dict[str, Any]] = []
-        for row in rows:
-            evaluations.append({k: row[k] for k in row.keys()})
-        return evaluations
-    finally:
-        conn.close()
+        return cur.fetchall()
 
 
-def fetch_evaluation_by_id(db_path: Path, eval_id: int) -> Dict[str, Any]:
+def fetch_evaluation_by_id(eval_id: int) -> Optional[Evaluation]:
     """Fetch a single evaluation by its ID.
 
-    Returns an empty dict if the record does not exist.
+    Returns ``None`` if the record does not exist.
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    with get_conn() as conn:
         cur = conn.cursor()
+        cur.row_factory = _evaluation_factory
         cur.execute("SELECT * FROM evaluations WHERE id = ?", (eval_id,))
-        row = cur.fetchone()
-        return {k: row[k] for k in row.keys()} if row else {}
-    finally:
-        conn.close()
+        return cur.fetchone()
+
 
+def fetch_evaluations_by_ids(ids: List[int]) -> List[Evaluation]:
+    """Fetch several evaluations with one query, preserving request order.
 
-def summary_counts_and_top(db_path: Path, user_id: int = None, top_n: int = 10) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+    Unknown ids are skipped rather than reported, matching the list
+    semantics of the batch API.
+    """
+    if not ids:
+        return []
+    placeholders = ",".join("?" * len(ids))
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.row_factory = _evaluation_factory
+        cur.execute(
+            f"SELECT * FROM evaluations WHERE id IN ({placeholders})", ids
+        )
+        by_id = {record.id: record for record in cur.fetchall()}
+    return [by_id[eval_id] for eval_id in ids if eval_id in by_id]
+
+
+# The eight CVSS v3.1 base metric keys, in vector order.  Shared by form
+# extraction, document-detection merging, and the result table so the
+# list is built once instead of being retyped at every use site.
+METRIC_KEYS = ("AV", "AC", "PR", "UI", "S", "C", "I", "A")
+
+# Columns included in the TSV export, in output order.
+_EXPORT_COLUMNS = (
+    "id", "title", "cve_id", "source", "metrics_json", "vector",
+    "base_score", "severity", "created_at",
+)
+
+# Column order of the tuples returned in the "top" result set of
+# summary_counts_and_top.  Rows stay as fetched tuples — callers unpack
+# them positionally (dashboard) or zip with this when a mapping is
+# genuinely needed, instead of paying for a dict per row.
+TOP_COLUMNS = (
+    "id", "title", "cve_id", "source", "metrics_json", "vector",
+    "base_score", "severity", "created_at", "user_id",
+    "full_name", "email",
+)
+
+# The subset of TOP_COLUMNS exposed by the summary API, and a C-level
+# slicer that pulls those fields out of a cached row tuple in one call.
+_TOP_API_COLUMNS = ("id", "title", "cve_id", "base_score", "severity", "created_at")
+_top_api_row = operator.itemgetter(
+    *(TOP_COLUMNS.index(name) for name in _TOP_API_COLUMNS)
+)
+
+
+# Short-TTL memo for summary_counts_and_top.  Dashboard pages and their
+# JSON polls repeat the same aggregate query many times between inserts;
+# a result is reused for up to _SUMMARY_TTL seconds, and the generation
+# counter — bumped by insert_evaluation — invalidates every entry the
+# moment the underlying data actually changes.
+_SUMMARY_TTL = 30.0
+_SUMMARY_STATE = {"generation": 0}
+_summary_cache: Dict[
+    Tuple[Optional[int], int],
+    Tuple[int, float, Tuple[Dict[str, int], List[Tuple]]],
+] = {}
+
+
+def summary_counts_and_top(user_id: int = None, top_n: int = 10) -> Tuple[Dict[str, int], List[Tuple]]:
     """Compute counts per severity and return the top N records by score.
 
+    Results are memoized per ``(user_id, top_n)`` for a short TTL and
+    invalidated immediately when an evaluation is inserted.
+
     Args:
-        db_path: Path to the database.
+        user_id: Restrict counts and top records to this user when given.
         top_n: Number of top records to return.
 
     Returns:
         A tuple ``(counts, top_list)`` where ``counts`` is a dict mapping
-        severity strings to integer counts, and ``top_list`` is a list
-        of the top N evaluation dictionaries ordered by score descending.
+        severity strings to integer counts, and ``top_list`` is a list of
+        the top N evaluation rows (tuples in ``TOP_COLUMNS`` order)
+        ordered by score descending.
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    key = (user_id, top_n)
+    generation = _SUMMARY_STATE["generation"]
+    now = time.monotonic()
+    hit = _summary_cache.get(key)
+    if hit is not None and hit[0] == generation and now - hit[1] < _SUMMARY_TTL:
+        return hit[2]
+    with get_conn() as conn:
         cur = conn.cursor()
-        # Count by severity (filter by user if provided)
-        if user_id:
-            cur.execute(
-                "SELECT severity, COUNT(*) as count FROM evaluations WHERE user_id = ? GROUP BY severity",
-                (user_id,)
-            )
-        else:
-            cur.execute(
-                "SELECT severity, COUNT(*) as count FROM evaluations GROUP BY severity"
-            )
-        counts = {row["severity"]: row["count"] for row in cur.fetchall()}
-
-        # Get top N by base_score descending (filter by user if provided)
-        if user_id:
-            cur.execute(
-                """
-                SELECT e.*, u.full_name, u.email
+        # Fetch counts and top-N in a single round trip: both result sets
+        # are tagged with a "kind" column and unioned, halving the SQLite
+        # parse/plan/execute overhead per dashboard hit.
+        counts_where = "WHERE user_id = ?" if user_id else ""
+        top_where = "WHERE e.user_id = ?" if user_id else ""
+        query = f"""
+            WITH c AS (
+                SELECT severity, COUNT(*) AS n
+                FROM evaluations {counts_where}
+                GROUP BY severity
+            ),
+            t AS (
+                SELECT e.id, e.title, e.cve_id, e.source, e.metrics_json,
+                       e.vector, e.base_score, e.severity, e.created_at,
+                       e.user_id, u.full_name, u.email
                 FROM evaluations e
                 LEFT JOIN users u ON e.user_id = u.id
-                WHERE e.user_id = ?
+                {top_where}
                 ORDER BY e.base_score DESC, e.created_at DESC
                 LIMIT ?
-                """,
-                (user_id, top_n),
             )
+            SELECT 'c' AS kind, severity, n, NULL, NULL, NULL, NULL,
+                   NULL, NULL, NULL, NULL, NULL, NULL
+            FROM c
+            UNION ALL
+            SELECT 't', id, title, cve_id, source, metrics_json, vector,
+                   base_score, severity, created_at, user_id, full_name, email
+            FROM t
+            ORDER BY kind, base_score DESC, created_at DESC
+        """
+        if user_id:
+            cur.execute(query, (user_id, user_id, top_n))
         else:
-            cur.execute(
-                """
-                SELECT e.*, u.full_name, u.email
-                FROM evaluations e
-                LEFT JOIN users u ON e.user_id = u.id
-                ORDER BY e.base_score DESC, e.created_at DESC
-                LIMIT ?
-                """,
-                (top_n,),
-            )
-        rows = cur.fetchall()
-        top_list: List[Dict[str, Any]] = []
-        for row in rows:
-            top_list.append({k: row[k] for k in row.keys()})
+            cur.execute(query, (top_n,))
+
+        counts: Dict[str, int] = {}
+        top_list: List[Tuple] = []
+        for row in cur.fetchall():
+            if row[0] == "c":
+                counts[row[1]] = row[2]
+            else:
+                top_list.append(row[1:])
+        _summary_cache[key] = (generation, now, (counts, top_list))
         return counts, top_list
-    finally:
-        conn.close()
 
 
 # ---------------------------------------------------------------------------
 # Helper functions for HTML generation
 # ---------------------------------------------------------------------------
 
+# Translation table for HTML escaping, built once at import.  str.translate
+# runs the whole scan in a single C loop, so escaping is cheap enough to
+# apply to anything interpolated into markup.
+_ESCAPE_TABLE = str.maketrans(
+    {"<": "&lt;", ">": "&gt;", "&": "&amp;", '"': "&quot;"}
+)
 
-def html_page(title: str, body: str) -> bytes:
-    """Wrap a body string in a simple HTML template.
 
-    Args:
-        title: The page title shown in the <title> tag.
-        body: Raw HTML content to insert into the <body>.
+def escape_html(value: str) -> str:
+    """Escape a string for safe interpolation into HTML."""
+    return value.translate(_ESCAPE_TABLE)
 
-    Returns:
-        Byte string of the complete HTML page encoded as UTF-8.
-    """
-    html = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{title}</title>
-        <style>
-            body {{ 
+
+# The stylesheet and modal script shared by every page, shipped as
+# standalone assets so browsers cache them once instead of re-downloading
+# kilobytes of identical inline CSS with every HTML response.  Hashed at
+# import so clients can revalidate with If-None-Match.
+_APP_CSS_BYTES = """\
+            body { 
                 font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
                 margin: 0; 
                 background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
                 min-height: 100vh;
                 color: #333;
-            }}
-            .container {{ 
+            }
+            .container { 
                 max-width: 1000px; 
                 margin: 0 auto; 
                 padding: 2rem;
@@ -356,29 +727,29 @@ def html_page(title: str, body: str) -> bytes:
                 box-shadow: 0 20px 40px rgba(0,0,0,0.1);
                 margin-top: 2rem;
                 margin-bottom: 2rem;
-            }}
-            h1 {{ 
+            }
+            h1 { 
                 color: #2c3e50; 
                 text-align: center;
                 margin-bottom: 2rem;
                 font-size: 2.5rem;
                 font-weight: 300;
                 text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            h2 {{ 
+            }
+            h2 { 
                 color: #34495e; 
                 border-bottom: 3px solid #3498db;
                 padding-bottom: 0.5rem;
                 margin-top: 2rem;
-            }}
-            label {{ 
+            }
+            label { 
                 display: block; 
                 margin-top: 1rem; 
                 font-weight: 600;
                 color: #2c3e50;
                 font-size: 0.95rem;
-            }}
-            select, input[type=text] {{ 
+            }
+            select, input[type=text] { 
                 width: 100%; 
                 padding: 0.75rem; 
                 margin-top: 0.5rem; 
@@ -387,13 +758,13 @@ def html_page(title: str, body: str) -> bytes:
                 font-size: 1rem;
                 transition: all 0.3s ease;
                 background: #fff;
-            }}
-            select:focus, input[type=text]:focus {{ 
+            }
+            select:focus, input[type=text]:focus { 
                 outline: none; 
                 border-color: #3498db; 
                 box-shadow: 0 0 0 3px rgba(52, 152, 219, 0.1);
-            }}
-            button {{ 
+            }
+            button { 
                 margin-top: 1.5rem; 
                 padding: 1rem 2rem; 
                 background: linear-gradient(45deg, #3498db, #2980b9); 
@@ -405,21 +776,21 @@ def html_page(title: str, body: str) -> bytes:
                 font-weight: 600;
                 transition: all 0.3s ease;
                 box-shadow: 0 4px 15px rgba(52, 152, 219, 0.3);
-            }}
-            button:hover {{ 
+            }
+            button:hover { 
                 background: linear-gradient(45deg, #2980b9, #1f5f8b);
                 transform: translateY(-2px);
                 box-shadow: 0 6px 20px rgba(52, 152, 219, 0.4);
-            }}
-            .result {{ 
+            }
+            .result { 
                 margin-top: 1.5rem; 
                 padding: 1.5rem; 
                 background: linear-gradient(135deg, #f8f9fa, #e9ecef);
                 border-radius: 12px;
                 border-left: 5px solid #3498db;
                 box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            }}
-            .severity-badge {{
+            }
+            .severity-badge {
                 display: inline-block;
                 padding: 0.5rem 1rem;
                 border-radius: 20px;
@@ -427,15 +798,15 @@ def html_page(title: str, body: str) -> bytes:
                 font-size: 0.9rem;
                 text-transform: uppercase;
                 letter-spacing: 0.5px;
-            }}
-            .severity-critical {{ background: linear-gradient(45deg, #e74c3c, #c0392b); color: white; }}
-            .severity-high {{ background: linear-gradient(45deg, #e67e22, #d35400); color: white; }}
-            .severity-medium {{ background: linear-gradient(45deg, #f39c12, #e67e22); color: white; }}
-            .severity-low {{ background: linear-gradient(45deg, #27ae60, #229954); color: white; }}
-            .severity-none {{ background: linear-gradient(45deg, #95a5a6, #7f8c8d); color: white; }}
-            .dashboard {{ display: flex; flex-direction: column; gap: 2rem; }}
-            .kpi {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1.5rem; }}
-            .kpi div {{ 
+            }
+            .severity-critical { background: linear-gradient(45deg, #e74c3c, #c0392b); color: white; }
+            .severity-high { background: linear-gradient(45deg, #e67e22, #d35400); color: white; }
+            .severity-medium { background: linear-gradient(45deg, #f39c12, #e67e22); color: white; }
+            .severity-low { background: linear-gradient(45deg, #27ae60, #229954); color: white; }
+            .severity-none { background: linear-gradient(45deg, #95a5a6, #7f8c8d); color: white; }
+            .dashboard { display: flex; flex-direction: column; gap: 2rem; }
+            .kpi { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1.5rem; }
+            .kpi div { 
                 background: linear-gradient(135deg, #fff, #f8f9fa); 
                 border: 1px solid #e0e6ed; 
                 border-radius: 12px; 
@@ -443,21 +814,21 @@ def html_page(title: str, body: str) -> bytes:
                 text-align: center; 
                 box-shadow: 0 4px 15px rgba(0,0,0,0.08);
                 transition: transform 0.3s ease;
-            }}
-            .kpi div:hover {{ transform: translateY(-5px); }}
-            .kpi h3 {{ 
+            }
+            .kpi div:hover { transform: translateY(-5px); }
+            .kpi h3 { 
                 margin: 0 0 0.5rem 0; 
                 font-size: 1.2rem; 
                 font-weight: 600;
                 color: #2c3e50;
-            }}
-            .kpi p {{ 
+            }
+            .kpi p { 
                 margin: 0; 
                 font-size: 2rem; 
                 font-weight: 700;
                 color: #3498db;
-            }}
-            .chart-bar-container {{ 
+            }
+            .chart-bar-container { 
                 display: flex; 
                 align-items: flex-end; 
                 height: 250px; 
@@ -467,29 +838,29 @@ def html_page(title: str, body: str) -> bytes:
                 border: 1px solid #e0e6ed; 
                 border-radius: 12px; 
                 box-shadow: 0 4px 15px rgba(0,0,0,0.08);
-            }}
-            .chart-bar {{ 
+            }
+            .chart-bar { 
                 flex: 1; 
                 display: flex; 
                 flex-direction: column; 
                 align-items: center; 
                 justify-content: flex-end; 
-            }}
-            .bar {{ 
+            }
+            .bar { 
                 width: 80%; 
                 border-radius: 8px 8px 0 0; 
                 transition: all 0.3s ease;
                 box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-            }}
-            .bar:hover {{ transform: scaleY(1.05); }}
-            .bar-label {{ 
+            }
+            .bar:hover { transform: scaleY(1.05); }
+            .bar-label { 
                 margin-top: 0.5rem; 
                 font-size: 0.85rem; 
                 color: #555; 
                 font-weight: 600;
                 text-align: center;
-            }}
-            table {{ 
+            }
+            table { 
                 width: 100%; 
                 border-collapse: collapse; 
                 margin-top: 1.5rem;
@@ -497,26 +868,26 @@ def html_page(title: str, body: str) -> bytes:
                 border-radius: 12px;
                 overflow: hidden;
                 box-shadow: 0 4px 15px rgba(0,0,0,0.08);
-            }}
-            th, td {{ 
+            }
+            th, td { 
                 padding: 1rem; 
                 border: 1px solid #e0e6ed; 
                 text-align: left; 
-            }}
-            th {{ 
+            }
+            th { 
                 background: linear-gradient(135deg, #3498db, #2980b9); 
                 color: white;
                 font-weight: 600;
                 text-transform: uppercase;
                 letter-spacing: 0.5px;
-            }}
-            tr:nth-child(even) {{ background-color: #f8f9fa; }}
-            tr:hover {{ background-color: #e3f2fd; }}
-            .nav-links {{
+            }
+            tr:nth-child(even) { background-color: #f8f9fa; }
+            tr:hover { background-color: #e3f2fd; }
+            .nav-links {
                 text-align: center;
                 margin: 2rem 0;
-            }}
-            .nav-links a {{
+            }
+            .nav-links a {
                 display: inline-block;
                 margin: 0 1rem;
                 padding: 0.75rem 1.5rem;
@@ -527,28 +898,28 @@ def html_page(title: str, body: str) -> bytes:
                 font-weight: 600;
                 transition: all 0.3s ease;
                 box-shadow: 0 4px 15px rgba(52, 152, 219, 0.3);
-            }}
-            .nav-links a:hover {{
+            }
+            .nav-links a:hover {
                 background: linear-gradient(45deg, #2980b9, #1f5f8b);
                 transform: translateY(-2px);
                 box-shadow: 0 6px 20px rgba(52, 152, 219, 0.4);
-            }}
-            footer {{ 
+            }
+            footer { 
                 margin-top: 3rem; 
                 font-size: 0.9rem; 
                 color: #7f8c8d; 
                 text-align: center;
                 padding: 1rem;
                 border-top: 1px solid #e0e6ed;
-            }}
-            .score-display {{
+            }
+            .score-display {
                 font-size: 3rem;
                 font-weight: 700;
                 text-align: center;
                 margin: 1rem 0;
                 text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            .vector-display {{
+            }
+            .vector-display {
                 background: #2c3e50;
                 color: #ecf0f1;
                 padding: 1rem;
@@ -557,117 +928,222 @@ def html_page(title: str, body: str) -> bytes:
                 font-size: 0.9rem;
                 word-break: break-all;
                 margin: 1rem 0;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-        {body}
-        </div>
-        <footer>
-            <p>CVSS Scoring System - MVP using Python Standard Library &amp; SQLite</p>
-        </footer>
-    </body>
-    </html>
-    """
-    return html.encode("utf-8")
-
-
-def render_login_page(error: str = None, success: str = None) -> bytes:
-    """Render the login page."""
-    error_html = ""
-    if error:
-        error_messages = {
-            "invalid_credentials": "Invalid email or password",
-            "missing_fields": "Please fill in all fields",
-            "server_error": "Server error. Please try again."
-        }
-        error_text = error_messages.get(error, "An error occurred")
-        error_html = f'<div class="error">{error_text}</div>'
-    
-    success_html = ""
-    if success:
-        success_messages = {
-            "registered": "Registration successful! Please log in."
+            }
+        .example-btn {
+            display: inline-block;
+            padding: 1rem 2rem;
+            background: linear-gradient(45deg, #28a745, #20c997);
+            color: white;
+            text-decoration: none;
+            border: none;
+            border-radius: 12px;
+            font-weight: 600;
+            font-size: 1.1rem;
+            transition: all 0.3s ease;
+            box-shadow: 0 6px 20px rgba(40, 167, 69, 0.3);
+            text-align: center;
+            cursor: pointer;
+            min-width: 250px;
+            margin: 0 auto;
         }
-        success_text = success_messages.get(success, "Success!")
-        success_html = f'<div class="success">{success_text}</div>'
-    
-    html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CVSS Server - Login</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
         
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 20px;
-        }}
+        .example-btn:hover {
+            background: linear-gradient(45deg, #20c997, #17a2b8);
+            transform: translateY(-3px);
+            box-shadow: 0 8px 25px rgba(40, 167, 69, 0.4);
+        }
         
-        .login-container {{
-            background: white;
-            padding: 40px;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+        .modal {
+            position: fixed;
+            z-index: 1000;
+            left: 0;
+            top: 0;
             width: 100%;
-            max-width: 400px;
-        }}
+            height: 100%;
+            background-color: rgba(0,0,0,0.5);
+        }
+        
+        .modal-content {
+            background-color: #fff;
+            margin: 3% auto;
+            padding: 2rem;
+            border-radius: 15px;
+            width: 90%;
+            max-width: 900px;
+            max-height: 85vh;
+            overflow-y: auto;
+            box-shadow: 0 25px 50px rgba(0,0,0,0.3);
+            border: 1px solid #e0e6ed;
+        }
+        
+        .close {
+            color: #aaa;
+            float: right;
+            font-size: 32px;
+            font-weight: bold;
+            cursor: pointer;
+            line-height: 1;
+            transition: color 0.3s ease;
+            margin-top: -10px;
+        }
+        
+        .close:hover {
+            color: #dc3545;
+        }
+        
+        @media (max-width: 768px) {
+            .modal-content {
+                width: 95%;
+                margin: 10% auto;
+                padding: 1rem;
+            }
+        }
+""".encode("utf-8")
+
+_APP_JS_BYTES = """\
+        function showExample() {
+            document.getElementById('exampleModal').style.display = 'block';
+        }
+        
+        function closeExample() {
+            document.getElementById('exampleModal').style.display = 'none';
+        }
+        
+        // Close modal when clicking outside
+        window.onclick = function(event) {
+            var modal = document.getElementById('exampleModal');
+            if (event.target == modal) {
+                modal.style.display = 'none';
+            }
+        }
+""".encode("utf-8")
+
+_APP_CSS_ETAG = f'"{hashlib.md5(_APP_CSS_BYTES).hexdigest()}"'
+_APP_JS_ETAG = f'"{hashlib.md5(_APP_JS_BYTES).hexdigest()}"'
+
+
+def _page_shell(title: str, body: str) -> str:
+    """Build the full page template around the two dynamic regions."""
+    return f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{title}</title>
+        <link rel="stylesheet" href="/static/app.css">
+        <script src="/static/app.js" defer></script>
+    </head>
+    <body>
+        <div class="container">
+        {body}
+        </div>
+        <footer>
+            <p>CVSS Scoring System - MVP using Python Standard Library &amp; SQLite</p>
+        </footer>
+    </body>
+    </html>
+    """
+
+
+# The page shell (CSS and scaffolding) is static, so render it once at
+# import with sentinel markers and keep the three fragments around the
+# dynamic title/body regions.  html_page then only joins five strings and
+# encodes the result.
+_PAGE_HEAD, _PAGE_MID, _PAGE_TAIL = re.split(
+    "\x00|\x01", _page_shell("\x00", "\x01")
+)
+
+
+def html_page(title: str, body: str) -> bytes:
+    """Wrap a body string in a simple HTML template.
+
+    Args:
+        title: The page title shown in the <title> tag.
+        body: Raw HTML content to insert into the <body>.
+
+    Returns:
+        Byte string of the complete HTML page encoded as UTF-8.
+    """
+    title = escape_html(title)
+    return "".join((_PAGE_HEAD, title, _PAGE_MID, body, _PAGE_TAIL)).encode("utf-8")
+
+
+_LOGIN_PAGE_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>CVSS Server - Login</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 20px;
+        }
+        
+        .login-container {
+            background: white;
+            padding: 40px;
+            border-radius: 20px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            width: 100%;
+            max-width: 400px;
+        }
         
-        .logo {{
+        .logo {
             text-align: center;
             margin-bottom: 30px;
-        }}
+        }
         
-        .logo h1 {{
+        .logo h1 {
             color: #333;
             font-size: 2rem;
             margin-bottom: 10px;
-        }}
+        }
         
-        .logo p {{
+        .logo p {
             color: #666;
             font-size: 0.9rem;
-        }}
+        }
         
-        .form-group {{
+        .form-group {
             margin-bottom: 20px;
-        }}
+        }
         
-        .form-group label {{
+        .form-group label {
             display: block;
             margin-bottom: 8px;
             color: #333;
             font-weight: 500;
-        }}
+        }
         
-        .form-group input {{
+        .form-group input {
             width: 100%;
             padding: 12px 16px;
             border: 2px solid #e1e5e9;
             border-radius: 10px;
             font-size: 1rem;
             transition: border-color 0.3s ease;
-        }}
+        }
         
-        .form-group input:focus {{
+        .form-group input:focus {
             outline: none;
             border-color: #667eea;
-        }}
+        }
         
-        .btn {{
+        .btn {
             width: 100%;
             padding: 12px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -678,44 +1154,44 @@ def render_login_page(error: str = None, success: str = None) -> bytes:
             font-weight: 600;
             cursor: pointer;
             transition: transform 0.2s ease;
-        }}
+        }
         
-        .btn:hover {{
+        .btn:hover {
             transform: translateY(-2px);
-        }}
+        }
         
-        .register-link {{
+        .register-link {
             text-align: center;
             margin-top: 20px;
-        }}
+        }
         
-        .register-link a {{
+        .register-link a {
             color: #667eea;
             text-decoration: none;
             font-weight: 500;
-        }}
+        }
         
-        .register-link a:hover {{
+        .register-link a:hover {
             text-decoration: underline;
-        }}
+        }
         
-        .error {{
+        .error {
             background: #fee;
             color: #c33;
             padding: 10px;
             border-radius: 8px;
             margin-bottom: 20px;
             border: 1px solid #fcc;
-        }}
+        }
         
-        .success {{
+        .success {
             background: #efe;
             color: #3c3;
             padding: 10px;
             border-radius: 8px;
             margin-bottom: 20px;
             border: 1px solid #cfc;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -725,8 +1201,8 @@ def render_login_page(error: str = None, success: str = None) -> bytes:
             <p>Sign in to your account</p>
         </div>
         
-        {error_html}
-        {success_html}
+        ${error_html}
+        ${success_html}
         
         <form method="POST" action="/login">
             <div class="form-group">
@@ -748,24 +1224,34 @@ def render_login_page(error: str = None, success: str = None) -> bytes:
     </div>
 </body>
 </html>
-    """
-    return html.encode('utf-8')
+    """)
 
-def render_register_page(error: str = None) -> bytes:
-    """Render the registration page."""
+
+def render_login_page(error: str = None, success: str = None) -> bytes:
+    """Render the login page."""
     error_html = ""
     if error:
         error_messages = {
-            "email_exists": "Email already registered",
-            "password_mismatch": "Passwords do not match",
-            "password_too_short": "Password must be at least 6 characters",
+            "invalid_credentials": "Invalid email or password",
             "missing_fields": "Please fill in all fields",
             "server_error": "Server error. Please try again."
         }
         error_text = error_messages.get(error, "An error occurred")
         error_html = f'<div class="error">{error_text}</div>'
     
-    html = f"""
+    success_html = ""
+    if success:
+        success_messages = {
+            "registered": "Registration successful! Please log in."
+        }
+        success_text = success_messages.get(success, "Success!")
+        success_html = f'<div class="success">{success_text}</div>'
+    
+    return _LOGIN_PAGE_TEMPLATE.substitute(
+        error_html=error_html, success_html=success_html
+    ).encode('utf-8')
+
+_REGISTER_PAGE_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -773,13 +1259,13 @@ def render_register_page(error: str = None) -> bytes:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>CVSS Server - Register</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
@@ -787,59 +1273,59 @@ def render_register_page(error: str = None) -> bytes:
             align-items: center;
             justify-content: center;
             padding: 20px;
-        }}
+        }
         
-        .register-container {{
+        .register-container {
             background: white;
             padding: 40px;
             border-radius: 20px;
             box-shadow: 0 20px 40px rgba(0,0,0,0.1);
             width: 100%;
             max-width: 400px;
-        }}
+        }
         
-        .logo {{
+        .logo {
             text-align: center;
             margin-bottom: 30px;
-        }}
+        }
         
-        .logo h1 {{
+        .logo h1 {
             color: #333;
             font-size: 2rem;
             margin-bottom: 10px;
-        }}
+        }
         
-        .logo p {{
+        .logo p {
             color: #666;
             font-size: 0.9rem;
-        }}
+        }
         
-        .form-group {{
+        .form-group {
             margin-bottom: 20px;
-        }}
+        }
         
-        .form-group label {{
+        .form-group label {
             display: block;
             margin-bottom: 8px;
             color: #333;
             font-weight: 500;
-        }}
+        }
         
-        .form-group input {{
+        .form-group input {
             width: 100%;
             padding: 12px 16px;
             border: 2px solid #e1e5e9;
             border-radius: 10px;
             font-size: 1rem;
             transition: border-color 0.3s ease;
-        }}
+        }
         
-        .form-group input:focus {{
+        .form-group input:focus {
             outline: none;
             border-color: #667eea;
-        }}
+        }
         
-        .btn {{
+        .btn {
             width: 100%;
             padding: 12px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -850,35 +1336,35 @@ def render_register_page(error: str = None) -> bytes:
             font-weight: 600;
             cursor: pointer;
             transition: transform 0.2s ease;
-        }}
+        }
         
-        .btn:hover {{
+        .btn:hover {
             transform: translateY(-2px);
-        }}
+        }
         
-        .login-link {{
+        .login-link {
             text-align: center;
             margin-top: 20px;
-        }}
+        }
         
-        .login-link a {{
+        .login-link a {
             color: #667eea;
             text-decoration: none;
             font-weight: 500;
-        }}
+        }
         
-        .login-link a:hover {{
+        .login-link a:hover {
             text-decoration: underline;
-        }}
+        }
         
-        .error {{
+        .error {
             background: #fee;
             color: #c33;
             padding: 10px;
             border-radius: 8px;
             margin-bottom: 20px;
             border: 1px solid #fcc;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -888,7 +1374,7 @@ def render_register_page(error: str = None) -> bytes:
             <p>Create your account</p>
         </div>
         
-        {error_html}
+        ${error_html}
         
         <form method="POST" action="/register">
             <div class="form-group">
@@ -920,26 +1406,101 @@ def render_register_page(error: str = None) -> bytes:
     </div>
 </body>
 </html>
+    """)
+
+
+def render_register_page(error: str = None) -> bytes:
+    """Render the registration page."""
+    error_html = ""
+    if error:
+        error_messages = {
+            "email_exists": "Email already registered",
+            "password_mismatch": "Passwords do not match",
+            "password_too_short": "Password must be at least 6 characters",
+            "missing_fields": "Please fill in all fields",
+            "server_error": "Server error. Please try again."
+        }
+        error_text = error_messages.get(error, "An error occurred")
+        error_html = f'<div class="error">{error_text}</div>'
+    
+    return _REGISTER_PAGE_TEMPLATE.substitute(
+        error_html=error_html
+    ).encode('utf-8')
+
+# The overwhelmingly common login/register hit carries no query string, so
+# the banner-free variants are rendered once at import and sent verbatim;
+# only requests that actually carry error/success parameters pay for a
+# template substitution.
+_LOGIN_PAGE_DEFAULT = render_login_page()
+_REGISTER_PAGE_DEFAULT = render_register_page()
+
+# Static example vulnerability report offered from the evaluation form.
+# The content mirrors the "Show Example Document" modal; it is encoded once
+# at import and materialized to a file on first use so responses can go out
+# through zero-copy os.sendfile instead of being pushed through userspace.
+_EXAMPLE_DOC_BYTES = """Vulnerability Report: Remote Code Execution
+
+CVE ID: CVE-2024-12345
+
+DESCRIPTION:
+This critical vulnerability allows remote attackers to execute arbitrary
+code over the network without requiring any user interaction. The attack
+complexity is low and requires no privileges. The vulnerability has high
+impact on confidentiality, integrity, and availability.
+
+TECHNICAL DETAILS:
+- The vulnerability is network accessible
+- Attack complexity is low and simple to exploit
+- No privileges are required for exploitation
+- No user interaction is needed
+- Scope is changed (affects different components)
+- Complete data disclosure is possible
+- Data modification can occur
+- Service disruption is complete
+
+CVSS METRICS:
+Attack Vector: Network
+Attack Complexity: Low
+Privileges Required: None
+User Interaction: None
+Scope: Changed
+Confidentiality Impact: High
+Integrity Impact: High
+Availability Impact: High
+
+EXPECTED RESULT:
+Base Score: 9.8 (Critical)
+Vector: CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H
+""".encode("utf-8")
+
+# Strong ETag for the example document, hashed once at import so clients
+# can revalidate with If-None-Match and get an empty 304 back.
+_EXAMPLE_DOC_ETAG = f'"{hashlib.md5(_EXAMPLE_DOC_BYTES).hexdigest()}"'
+
+_example_doc_file_handle = None
+
+
+def _example_doc_file():
+    """Return the open temp file backing the example document on disk.
+
+    The file (and its descriptor) is created once and kept open across
+    requests so serve_example_document can hand it to os.sendfile.
     """
-    return html.encode('utf-8')
+    global _example_doc_file_handle
+    if _example_doc_file_handle is None:
+        handle = tempfile.NamedTemporaryFile(
+            prefix="cvss_example_", suffix=".txt"
+        )
+        handle.write(_EXAMPLE_DOC_BYTES)
+        handle.flush()
+        _example_doc_file_handle = handle
+    return _example_doc_file_handle
 
-def render_form(user: Dict[str, Any] = None) -> bytes:
-    """Generate the HTML for the evaluation form."""
-    # Options for each metric according to CVSS v3.1 specification.
-    av_options = [("N", "Network (N)"), ("A", "Adjacent (A)"), ("L", "Local (L)"), ("P", "Physical (P)")]
-    ac_options = [("L", "Low (L)"), ("H", "High (H)")]
-    pr_options = [("N", "None (N)"), ("L", "Low (L)"), ("H", "High (H)")]
-    ui_options = [("N", "None (N)"), ("R", "Required (R)")]
-    s_options = [("U", "Unchanged (U)"), ("C", "Changed (C)")]
-    impact_options = [("N", "None (N)"), ("L", "Low (L)"), ("H", "High (H)")]
-
-    def options_html(options: List[Tuple[str, str]]) -> str:
-        return "".join([f"<option value=\"{val}\">{label}</option>" for val, label in options])
-
-    # Document upload section
-    document_upload_section = ""
-    if document_processor:
-        document_upload_section = """
+
+# Static document-upload section for the evaluation form, including the
+# example modal and its CSS/JS.  Built once at import; render_form only
+# decides whether to include it.
+_DOCUMENT_UPLOAD_SECTION = """
         <h2>📄 Document Analysis (Optional)</h2>
         <p style="text-align: center; color: #7f8c8d; margin-bottom: 1rem;">
             Upload a Word (.docx) or PDF document to automatically extract CVSS metrics from the text.
@@ -956,6 +1517,9 @@ def render_form(user: Dict[str, Any] = None) -> bytes:
                 <p style="font-size: 0.9rem; color: #155724; margin-top: 0.5rem;">
                     See how to structure your document for better CVSS metric detection
                 </p>
+                <p style="font-size: 0.9rem; margin-top: 0.5rem;">
+                    <a href="/download-example" style="color: #155724;">⬇️ Download the example as a text file</a>
+                </p>
             </div>
             
             <div style="background: #fff; border-radius: 10px; padding: 1.5rem; border-left: 5px solid #28a745; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
@@ -1019,109 +1583,47 @@ def render_form(user: Dict[str, Any] = None) -> bytes:
             </div>
         </div>
         
-        <style>
-        .example-btn {
-            display: inline-block;
-            padding: 1rem 2rem;
-            background: linear-gradient(45deg, #28a745, #20c997);
-            color: white;
-            text-decoration: none;
-            border: none;
-            border-radius: 12px;
-            font-weight: 600;
-            font-size: 1.1rem;
-            transition: all 0.3s ease;
-            box-shadow: 0 6px 20px rgba(40, 167, 69, 0.3);
-            text-align: center;
-            cursor: pointer;
-            min-width: 250px;
-            margin: 0 auto;
-        }
-        
-        .example-btn:hover {
-            background: linear-gradient(45deg, #20c997, #17a2b8);
-            transform: translateY(-3px);
-            box-shadow: 0 8px 25px rgba(40, 167, 69, 0.4);
-        }
-        
-        .modal {
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0,0,0,0.5);
-        }
-        
-        .modal-content {
-            background-color: #fff;
-            margin: 3% auto;
-            padding: 2rem;
-            border-radius: 15px;
-            width: 90%;
-            max-width: 900px;
-            max-height: 85vh;
-            overflow-y: auto;
-            box-shadow: 0 25px 50px rgba(0,0,0,0.3);
-            border: 1px solid #e0e6ed;
-        }
-        
-        .close {
-            color: #aaa;
-            float: right;
-            font-size: 32px;
-            font-weight: bold;
-            cursor: pointer;
-            line-height: 1;
-            transition: color 0.3s ease;
-            margin-top: -10px;
-        }
-        
-        .close:hover {
-            color: #dc3545;
-        }
-        
-        @media (max-width: 768px) {
-            .modal-content {
-                width: 95%;
-                margin: 10% auto;
-                padding: 1rem;
-            }
-        }
-        </style>
-        
-        <script>
-        function showExample() {
-            document.getElementById('exampleModal').style.display = 'block';
-        }
-        
-        function closeExample() {
-            document.getElementById('exampleModal').style.display = 'none';
-        }
-        
-        // Close modal when clicking outside
-        window.onclick = function(event) {
-            var modal = document.getElementById('exampleModal');
-            if (event.target == modal) {
-                modal.style.display = 'none';
-            }
-        }
-        </script>
         """
 
-    # User info section
-    user_info = ""
-    if user:
-        user_info = f"""
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1rem; border-radius: 10px; margin-bottom: 1.5rem; display: flex; justify-content: space-between; align-items: center; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-            <span style="font-size: 1rem;">Welcome, <strong>{user['full_name']}</strong> ({user['email']})</span>
-            <a href="/logout" style="background: rgba(255,255,255,0.2); color: white; padding: 0.5rem 1rem; border-radius: 6px; text-decoration: none; font-weight: 500; transition: all 0.3s ease; border: 1px solid rgba(255,255,255,0.3);">Logout</a>
-        </div>
-        """
 
-    form_html = f"""
-    {user_info}
+# Options for each metric according to CVSS v3.1 specification.  The sets
+# are static, so the <option> markup is rendered once at module load rather
+# than eight times per render_form call.
+_AV_OPTIONS = [("N", "Network (N)"), ("A", "Adjacent (A)"), ("L", "Local (L)"), ("P", "Physical (P)")]
+_AC_OPTIONS = [("L", "Low (L)"), ("H", "High (H)")]
+_PR_OPTIONS = [("N", "None (N)"), ("L", "Low (L)"), ("H", "High (H)")]
+_UI_OPTIONS = [("N", "None (N)"), ("R", "Required (R)")]
+_S_OPTIONS = [("U", "Unchanged (U)"), ("C", "Changed (C)")]
+_IMPACT_OPTIONS = [("N", "None (N)"), ("L", "Low (L)"), ("H", "High (H)")]
+
+
+def _options_html(options: List[Tuple[str, str]]) -> str:
+    return "".join([f"<option value=\"{val}\">{label}</option>" for val, label in options])
+
+
+_AV_OPTIONS_HTML = _options_html(_AV_OPTIONS)
+_AC_OPTIONS_HTML = _options_html(_AC_OPTIONS)
+_PR_OPTIONS_HTML = _options_html(_PR_OPTIONS)
+_UI_OPTIONS_HTML = _options_html(_UI_OPTIONS)
+_S_OPTIONS_HTML = _options_html(_S_OPTIONS)
+_IMPACT_OPTIONS_HTML = _options_html(_IMPACT_OPTIONS)
+
+
+# The evaluation form is static apart from the welcome banner, so both
+# variants are preassembled at import: a finished page for anonymous
+# visitors, and a bytes "%"-template for authenticated users with slots
+# for the name and e-mail.  The banner is spliced in via a sentinel (the
+# same trick as the page shell) after doubling literal percent signs so
+# the "%"-format only sees the two intended slots.
+_FORM_USER_INFO_TEMPLATE = (
+    '<div style="background: linear-gradient(135deg, #667eea 0%%, #764ba2 100%%); color: white; padding: 1rem; border-radius: 10px; margin-bottom: 1.5rem; display: flex; justify-content: space-between; align-items: center; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">'
+    '<span style="font-size: 1rem;">Welcome, <strong>%s</strong> (%s)</span>'
+    '<a href="/logout" style="background: rgba(255,255,255,0.2); color: white; padding: 0.5rem 1rem; border-radius: 6px; text-decoration: none; font-weight: 500; transition: all 0.3s ease; border: 1px solid rgba(255,255,255,0.3);">Logout</a>'
+    "</div>"
+).encode("utf-8")
+
+_FORM_BODY = f"""
+    \x00
     <h1>CVSS v3.1 Evaluation</h1>
     <p style="text-align: center; color: #7f8c8d; margin-bottom: 2rem;">
         Enter the details of a vulnerability and select the appropriate CVSS v3.1 base metrics, or upload a document for automatic analysis.
@@ -1138,47 +1640,47 @@ def render_form(user: Dict[str, Any] = None) -> bytes:
         <label for="source">Source (optional)</label>
         <input type="text" id="source" name="source" placeholder="Internal, NVD, etc." />
 
-        {document_upload_section}
+        {_DOCUMENT_UPLOAD_SECTION if _DOC_PROCESSOR_AVAILABLE else ""}
 
         <h2>CVSS Base Metrics</h2>
         <label for="AV">Attack Vector (AV)</label>
         <select id="AV" name="AV" required>
-            {options_html(av_options)}
+            {_AV_OPTIONS_HTML}
         </select>
 
         <label for="AC">Attack Complexity (AC)</label>
         <select id="AC" name="AC" required>
-            {options_html(ac_options)}
+            {_AC_OPTIONS_HTML}
         </select>
 
         <label for="PR">Privileges Required (PR)</label>
         <select id="PR" name="PR" required>
-            {options_html(pr_options)}
+            {_PR_OPTIONS_HTML}
         </select>
 
         <label for="UI">User Interaction (UI)</label>
         <select id="UI" name="UI" required>
-            {options_html(ui_options)}
+            {_UI_OPTIONS_HTML}
         </select>
 
         <label for="S">Scope (S)</label>
         <select id="S" name="S" required>
-            {options_html(s_options)}
+            {_S_OPTIONS_HTML}
         </select>
 
         <label for="C">Confidentiality Impact (C)</label>
         <select id="C" name="C" required>
-            {options_html(impact_options)}
+            {_IMPACT_OPTIONS_HTML}
         </select>
 
         <label for="I">Integrity Impact (I)</label>
         <select id="I" name="I" required>
-            {options_html(impact_options)}
+            {_IMPACT_OPTIONS_HTML}
         </select>
 
         <label for="A">Availability Impact (A)</label>
         <select id="A" name="A" required>
-            {options_html(impact_options)}
+            {_IMPACT_OPTIONS_HTML}
         </select>
 
         <button type="submit">Calculate CVSS Score</button>
@@ -1188,7 +1690,27 @@ def render_form(user: Dict[str, Any] = None) -> bytes:
         <a href="/dashboard">View Dashboard</a>
     </div>
     """
-    return html_page("CVSS Evaluation", form_html)
+
+_FORM_PAGE_ANON = html_page("CVSS Evaluation", _FORM_BODY).replace(b"\x00", b"")
+_FORM_PAGE_AUTH_TEMPLATE = (
+    html_page("CVSS Evaluation", _FORM_BODY)
+    .replace(b"%", b"%%")
+    .replace(b"\x00", _FORM_USER_INFO_TEMPLATE)
+)
+
+
+def render_form(user: Dict[str, Any] = None) -> bytes:
+    """Generate the HTML for the evaluation form.
+
+    Both variants are preassembled at import; the authenticated one costs
+    a single "%"-format to fill the welcome banner.
+    """
+    if not user:
+        return _FORM_PAGE_ANON
+    return _FORM_PAGE_AUTH_TEMPLATE % (
+        escape_html(user['full_name']).encode("utf-8"),
+        escape_html(user['email']).encode("utf-8"),
+    )
 
 
 def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str], base_score: float, severity: str, vector: str, document_analysis: Dict[str, any] = None, user: Dict[str, Any] = None) -> bytes:
@@ -1206,13 +1728,13 @@ def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str],
     }
     rows = "".join(
         [
-            f"<tr><th>{metric_names[k]}</th><td>{metrics[k]}</td></tr>"
-            for k in ["AV", "AC", "PR", "UI", "S", "C", "I", "A"]
+            f"<tr><th>{metric_names[k]}</th><td>{escape_html(metrics[k])}</td></tr>"
+            for k in METRIC_KEYS
         ]
     )
     
     # Get severity class for styling
-    severity_class = f"severity-{severity.lower()}"
+    severity_class = _SEV_CLASS[severity]
     
     # Document analysis section
     document_section = ""
@@ -1223,9 +1745,9 @@ def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str],
         <div class="result" style="background: linear-gradient(135deg, #e8f5e8, #d4edda); border-left: 5px solid #28a745;">
             <h3>📋 Extracted Information</h3>
             <table>
-                <tr><th>Filename</th><td>{doc.get('filename', 'Unknown')}</td></tr>
-                <tr><th>Detected Title</th><td>{doc.get('title', 'Not detected')}</td></tr>
-                <tr><th>Detected CVE ID</th><td>{doc.get('cve_id', 'Not detected')}</td></tr>
+                <tr><th>Filename</th><td>{escape_html(doc.get('filename') or 'Unknown')}</td></tr>
+                <tr><th>Detected Title</th><td>{escape_html(doc.get('title') or 'Not detected')}</td></tr>
+                <tr><th>Detected CVE ID</th><td>{escape_html(doc.get('cve_id') or 'Not detected')}</td></tr>
             </table>
             
             <h3>🔍 Detected CVSS Metrics</h3>
@@ -1243,7 +1765,7 @@ def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str],
             
             <h3>📝 Extracted Text (Preview)</h3>
             <div style="background: #f8f9fa; padding: 1rem; border-radius: 8px; max-height: 200px; overflow-y: auto; font-family: monospace; font-size: 0.9rem;">
-                {doc.get('text', 'No text extracted')}
+                {escape_html(doc.get('text') or 'No text extracted')}
             </div>
         </div>
         """
@@ -1252,8 +1774,8 @@ def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str],
         <h2>📄 Document Analysis Results</h2>
         <div class="result" style="background: linear-gradient(135deg, #ffeaea, #f8d7da); border-left: 5px solid #dc3545;">
             <h3>❌ Document Processing Error</h3>
-            <p><strong>Error:</strong> {document_analysis.get('error', 'Unknown error')}</p>
-            <p><strong>Filename:</strong> {document_analysis.get('filename', 'Unknown')}</p>
+            <p><strong>Error:</strong> {escape_html(document_analysis.get('error') or 'Unknown error')}</p>
+            <p><strong>Filename:</strong> {escape_html(document_analysis.get('filename') or 'Unknown')}</p>
         </div>
         """
     
@@ -1269,7 +1791,7 @@ def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str],
         </div>
         <div class="vector-display">
             <strong>CVSS Vector:</strong><br>
-            {vector}
+            {escape_html(vector)}
         </div>
     </div>
     
@@ -1277,10 +1799,10 @@ def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str],
     
     <h2>Vulnerability Details</h2>
     <table>
-        <tr><th>Title</th><td>{title or '-'}</td></tr>
-        <tr><th>CVE ID</th><td>{cve_id or '-'}</td></tr>
-        <tr><th>Source</th><td>{source or '-'}</td></tr>
-        {f'<tr><th>Evaluated by</th><td><strong>{user["full_name"]}</strong> ({user["email"]})</td></tr>' if user else ''}
+        <tr><th>Title</th><td>{escape_html(title) if title else '-'}</td></tr>
+        <tr><th>CVE ID</th><td>{escape_html(cve_id) if cve_id else '-'}</td></tr>
+        <tr><th>Source</th><td>{escape_html(source) if source else '-'}</td></tr>
+        {f'<tr><th>Evaluated by</th><td><strong>{escape_html(user["full_name"])}</strong> ({escape_html(user["email"])})</td></tr>' if user else ''}
     </table>
     
     <h2>CVSS Base Metrics</h2>
@@ -1296,7 +1818,7 @@ def render_result(title: str, cve_id: str, source: str, metrics: Dict[str, str],
     return html_page("CVSS Result", result_html)
 
 
-def render_dashboard(counts: Dict[str, int], top_list: List[Dict[str, Any]], user: Dict[str, Any] = None, show_all: bool = True) -> bytes:
+def render_dashboard(counts: Dict[str, int], top_list: List[Tuple], user: Dict[str, Any] = None, show_all: bool = True) -> bytes:
     """Generate HTML for the dashboard page.
 
     The dashboard shows KPIs for each severity category and a
@@ -1305,47 +1827,41 @@ def render_dashboard(counts: Dict[str, int], top_list: List[Dict[str, Any]], use
 
     Args:
         counts: Mapping of severity to counts.
-        top_list: List of evaluation records sorted by score.
+        top_list: Evaluation rows (``TOP_COLUMNS`` tuples) sorted by score.
     """
     # Ensure all categories are present
-    categories = ["Critical", "High", "Medium", "Low", "None"]
+    categories = _DASH_CATEGORIES
     counts_full = {cat: counts.get(cat, 0) for cat in categories}
     # Determine the maximum count for scaling the bars
     max_count = max(counts_full.values()) or 1
-    
-    # Generate HTML for KPIs with severity colors
+
+    # Fill the prebuilt KPI and bar templates with this request's numbers
     kpi_html = "".join(
-        [
-            f"<div style=\"border-left: 4px solid {color_for_cat(cat)};\">"
-            f"<h3>{cat}</h3><p>{counts_full[cat]}</p></div>"
-            for cat in categories
-        ]
+        _KPI_TEMPLATES[cat] % counts_full[cat] for cat in categories
     )
-    
-    # Generate bar chart HTML
     bars_html = "".join(
-        [
-            f"<div class=\"chart-bar\">"
-            f"<div class=\"bar\" style=\"height: {counts_full[cat] / max_count * 100:.1f}%; background: linear-gradient(to top, {color_for_cat(cat)}, {color_for_cat(cat)}dd);\"></div>"
-            f"<div class=\"bar-label\">{cat}<br><strong>{counts_full[cat]}</strong></div></div>"
-            for cat in categories
-        ]
+        _BAR_TEMPLATES[cat] % (counts_full[cat] / max_count * 100, counts_full[cat])
+        for cat in categories
     )
     
-    # Generate top table HTML with severity badges
+    # Generate top table HTML with severity badges.  Each row is a single
+    # "%"-format into the prebuilt template and the fragments are joined
+    # in one pass; the tuples are unpacked positionally (TOP_COLUMNS
+    # order), avoiding six dict lookups per row.
     rows = "".join(
-        [
-            f"<tr>"
-            f"<td>{rec['id']}</td>"
-            f"<td>{rec['title'] or '-'}</td>"
-            f"<td>{rec['cve_id'] or '-'}</td>"
-            f"<td><strong>{rec['base_score']}</strong></td>"
-            f"<td><span class=\"severity-badge severity-{rec['severity'].lower()}\">{rec['severity']}</span></td>"
-            f"<td>{rec['created_at'][:19]}</td>"
-            f"<td>{rec.get('full_name', 'Unknown')} ({rec.get('email', 'N/A')})</td>"
-            f"</tr>"
-            for rec in top_list
-        ]
+        _DASH_ROW_TEMPLATE % (
+            rec_id,
+            escape_html(title) if title else "-",
+            escape_html(cve_id) if cve_id else "-",
+            base_score,
+            _SEV_CLASS[severity],
+            severity,
+            escape_html(created_at[:19]),
+            escape_html(full_name or "Unknown"),
+            escape_html(email or "N/A"),
+        )
+        for (rec_id, title, cve_id, _source, _metrics, _vector, base_score,
+             severity, created_at, _uid, full_name, email) in top_list
     )
     
     table_title = "Top Evaluations (All Users)" if show_all else "My Top Evaluations"
@@ -1362,7 +1878,7 @@ def render_dashboard(counts: Dict[str, int], top_list: List[Dict[str, Any]], use
     if user:
         user_info = f"""
         <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1rem; border-radius: 10px; margin-bottom: 1.5rem; display: flex; justify-content: space-between; align-items: center; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-            <span style="font-size: 1rem;">Welcome, <strong>{user['full_name']}</strong> ({user['email']})</span>
+            <span style="font-size: 1rem;">Welcome, <strong>{escape_html(user['full_name'])}</strong> ({escape_html(user['email'])})</span>
             <a href="/logout" style="background: rgba(255,255,255,0.2); color: white; padding: 0.5rem 1rem; border-radius: 6px; text-decoration: none; font-weight: 500; transition: all 0.3s ease; border: 1px solid rgba(255,255,255,0.3);">Logout</a>
         </div>
         """
@@ -1401,107 +1917,172 @@ def render_dashboard(counts: Dict[str, int], top_list: List[Dict[str, Any]], use
     return html_page("Dashboard", dashboard_html)
 
 
+# Severity colours, hoisted to module scope so color_for_cat does a single
+# dict lookup instead of rebuilding the literal on every call.
+_CAT_COLORS = {
+    "Critical": "#dc3545",  # red
+    "High": "#fd7e14",     # orange
+    "Medium": "#ffc107",   # yellow
+    "Low": "#198754",      # green
+    "None": "#6c757d",     # grey
+}
+
+
 def color_for_cat(cat: str) -> str:
     """Assign a colour to each severity category for the bar chart."""
-    return {
-        "Critical": "#dc3545",  # red
-        "High": "#fd7e14",     # orange
-        "Medium": "#ffc107",   # yellow
-        "Low": "#198754",      # green
-        "None": "#6c757d",     # grey
-    }.get(cat, "#0d6efd")  # default blue
+    return _CAT_COLORS.get(cat, "#0d6efd")  # default blue
+
+
+# Severity categories in dashboard display order, plus per-category KPI and
+# bar-chart templates built once at import with the colours baked in.  The
+# per-request work is then one "%"-format of the numbers per cell instead of
+# rebuilding each f-string from scratch.
+_DASH_CATEGORIES = ("Critical", "High", "Medium", "Low", "None")
+
+# Severity → CSS badge class, precomputed so per-row rendering is one dict
+# lookup instead of a fresh ``.lower()`` allocation per row.
+_SEV_CLASS = {cat: f"severity-{cat.lower()}" for cat in _DASH_CATEGORIES}
+
+_KPI_TEMPLATES = {
+    cat: (
+        '<div style="border-left: 4px solid {color};">'
+        "<h3>{cat}</h3><p>%d</p></div>"
+    ).format(color=color_for_cat(cat), cat=cat)
+    for cat in _DASH_CATEGORIES
+}
+
+_BAR_TEMPLATES = {
+    cat: (
+        '<div class="chart-bar">'
+        '<div class="bar" style="height: %.1f%%; '
+        'background: linear-gradient(to top, {color}, {color}dd);"></div>'
+        '<div class="bar-label">{cat}<br><strong>%d</strong></div></div>'
+    ).format(color=color_for_cat(cat), cat=cat)
+    for cat in _DASH_CATEGORIES
+}
+
+# Row template for the dashboard's top-evaluations table.  The dashboard
+# body stays in str space until html_page does its single encode, so the
+# rows are assembled as one "%"-format per record joined in one pass.
+_DASH_ROW_TEMPLATE = (
+    "<tr>"
+    "<td>%d</td>"
+    "<td>%s</td>"
+    "<td>%s</td>"
+    "<td><strong>%s</strong></td>"
+    '<td><span class="severity-badge %s">%s</span></td>'
+    "<td>%s</td>"
+    "<td>%s (%s)</td>"
+    "</tr>"
+)
 
 
 # ---------------------------------------------------------------------------
 # Authentication functions
 # ---------------------------------------------------------------------------
 
+# Work factor for PBKDF2; the whole derivation loop runs inside OpenSSL.
+_PBKDF2_ITERATIONS = 100_000
+
+
 def hash_password(password: str) -> str:
-    """Hash a password using SHA256 with salt."""
-    salt = secrets.token_hex(16)
-    password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-    return f"{salt}:{password_hash}"
+    """Hash a password with PBKDF2-HMAC-SHA256 and a random salt.
+
+    Stored as ``pbkdf2:`` plus base64(salt + derived key); the legacy
+    ``salt:sha256hex`` records are still accepted by verify_password.
+    """
+    salt = secrets.token_bytes(16)
+    dk = hashlib.pbkdf2_hmac(
+        'sha256', password.encode(), salt, _PBKDF2_ITERATIONS, 32
+    )
+    return "pbkdf2:" + base64.b64encode(salt + dk).decode('ascii')
 
 def verify_password(password: str, stored_hash: str) -> bool:
-    """Verify a password against its hash."""
+    """Verify a password against its stored hash (current or legacy format)."""
     try:
+        if stored_hash.startswith('pbkdf2:'):
+            raw = base64.b64decode(stored_hash[7:])
+            salt, dk = raw[:16], raw[16:]
+            candidate = hashlib.pbkdf2_hmac(
+                'sha256', password.encode(), salt, _PBKDF2_ITERATIONS, 32
+            )
+            return hmac.compare_digest(candidate, dk)
+        # Legacy salted-SHA256 record from databases created before PBKDF2
         salt, password_hash = stored_hash.split(':')
-        return hashlib.sha256((password + salt).encode()).hexdigest() == password_hash
-    except:
+        return hmac.compare_digest(
+            hashlib.sha256((password + salt).encode()).hexdigest(),
+            password_hash,
+        )
+    except Exception:
         return False
 
 def create_user(email: str, password: str, full_name: str) -> Dict[str, Any]:
     """Create a new user account."""
-    conn = sqlite3.connect(DB_PATH)
     try:
-        cur = conn.cursor()
-        
-        # Check if user already exists
-        cur.execute("SELECT id FROM users WHERE email = ?", (email,))
-        if cur.fetchone():
-            return {"success": False, "error": "Email already registered"}
-        
-        # Create user
-        password_hash = hash_password(password)
-        cur.execute(
-            "INSERT INTO users (email, password_hash, full_name) VALUES (?, ?, ?)",
-            (email, password_hash, full_name)
-        )
-        user_id = cur.lastrowid
-        conn.commit()
-        
-        return {"success": True, "user_id": user_id}
+        with get_conn() as conn:
+            cur = conn.cursor()
+
+            # Check if user already exists
+            cur.execute("SELECT id FROM users WHERE email = ?", (email,))
+            if cur.fetchone():
+                return {"success": False, "error": "Email already registered"}
+
+            # Create user
+            password_hash = hash_password(password)
+            cur.execute(
+                "INSERT INTO users (email, password_hash, full_name) VALUES (?, ?, ?)",
+                (email, password_hash, full_name)
+            )
+            user_id = cur.lastrowid
+            conn.commit()
+
+            return {"success": True, "user_id": user_id}
     except Exception as e:
         return {"success": False, "error": str(e)}
-    finally:
-        conn.close()
 
 def authenticate_user(email: str, password: str) -> Dict[str, Any]:
     """Authenticate a user and return user info."""
-    conn = sqlite3.connect(DB_PATH)
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT id, email, password_hash, full_name FROM users WHERE email = ? AND is_active = 1",
-            (email,)
-        )
-        user = cur.fetchone()
-        
-        if not user:
-            return {"success": False, "error": "Invalid email or password"}
-        
-        user_id, user_email, password_hash, full_name = user
-        
-        if not verify_password(password, password_hash):
-            return {"success": False, "error": "Invalid email or password"}
-        
-        # Update last login
-        cur.execute(
-            "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?",
-            (user_id,)
-        )
-        conn.commit()
-        
-        return {
-            "success": True,
-            "user": {
-                "user_id": user_id,
-                "email": user_email,
-                "full_name": full_name
+        with get_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT id, email, password_hash, full_name FROM users WHERE email = ? AND is_active = 1",
+                (email,)
+            )
+            user = cur.fetchone()
+
+            if not user:
+                return {"success": False, "error": "Invalid email or password"}
+
+            user_id, user_email, password_hash, full_name = user
+
+            if not verify_password(password, password_hash):
+                return {"success": False, "error": "Invalid email or password"}
+
+            # Update last login
+            cur.execute(
+                "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?",
+                (user_id,)
+            )
+            conn.commit()
+
+            return {
+                "success": True,
+                "user": {
+                    "user_id": user_id,
+                    "email": user_email,
+                    "full_name": full_name
+                }
             }
-        }
     except Exception as e:
         return {"success": False, "error": str(e)}
-    finally:
-        conn.close()
 
 def create_session(user_id: int) -> str:
     """Create a new session for a user."""
     session_token = secrets.token_urlsafe(32)
     expires_at = datetime.utcnow() + timedelta(days=7)
-    
-    conn = sqlite3.connect(DB_PATH)
-    try:
+
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute(
             "INSERT INTO user_sessions (user_id, session_token, expires_at) VALUES (?, ?, ?)",
@@ -1509,93 +2090,228 @@ def create_session(user_id: int) -> str:
         )
         conn.commit()
         return session_token
-    finally:
-        conn.close()
+
+# Validated sessions cached by token, so an authenticated browsing session
+# pays the users/user_sessions JOIN once instead of on every request.
+# Entries expire with the session itself; the lock guards the dict against
+# concurrent request threads, and insertion-order eviction bounds the size.
+_SESSION_CACHE_MAX = 1024
+_session_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+_session_cache_lock = threading.Lock()
+
 
 def validate_session(session_token: str) -> Optional[Dict[str, Any]]:
-    """Validate a session token and return user info."""
-    conn = sqlite3.connect(DB_PATH)
+    """Validate a session token and return user info.
+
+    Serves repeat lookups from the in-process cache and falls through to
+    the database only for unknown tokens or expired cache entries.
+    """
+    now = time.time()
+    with _session_cache_lock:
+        hit = _session_cache.get(session_token)
+        if hit is not None:
+            user, cached_until = hit
+            if now < cached_until:
+                return user
+            del _session_cache[session_token]
     try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT u.id, u.email, u.full_name, s.expires_at
-            FROM users u
-            JOIN user_sessions s ON u.id = s.user_id
-            WHERE s.session_token = ? AND u.is_active = 1
-            """,
-            (session_token,)
-        )
-        result = cur.fetchone()
-        
-        if not result:
-            return None
-        
-        user_id, email, full_name, expires_at_str = result
-        expires_at = datetime.fromisoformat(expires_at_str)
-        
-        if datetime.utcnow() > expires_at:
-            # Session expired, clean it up
-            cur.execute("DELETE FROM user_sessions WHERE session_token = ?", (session_token,))
-            conn.commit()
-            return None
-        
-        return {
-            "user_id": user_id,
-            "email": email,
-            "full_name": full_name
-        }
+        with get_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                SELECT u.id, u.email, u.full_name, s.expires_at
+                FROM users u
+                JOIN user_sessions s ON u.id = s.user_id
+                WHERE s.session_token = ? AND u.is_active = 1
+                """,
+                (session_token,)
+            )
+            result = cur.fetchone()
+
+            if not result:
+                return None
+
+            user_id, email, full_name, expires_at_str = result
+            expires_at = datetime.fromisoformat(expires_at_str)
+
+            remaining = (expires_at - datetime.utcnow()).total_seconds()
+            if remaining <= 0:
+                # Expired: reject, but leave deletion to the background
+                # sweeper so authentication never writes on the hot path.
+                return None
+
+            user = {
+                "user_id": user_id,
+                "email": email,
+                "full_name": full_name
+            }
+            with _session_cache_lock:
+                if len(_session_cache) >= _SESSION_CACHE_MAX:
+                    _session_cache.pop(next(iter(_session_cache)))
+                _session_cache[session_token] = (user, now + remaining)
+            return user
     except:
         return None
-    finally:
-        conn.close()
+
+# How often the background sweeper deletes expired session rows.  The
+# request path only ever reads sessions; batching deletions here keeps
+# the WAL writer free for evaluation inserts during traffic spikes.
+_SESSION_SWEEP_INTERVAL = 300.0
+
+
+def _sweep_expired_sessions() -> None:
+    """Delete expired session rows in one transaction."""
+    try:
+        with get_conn() as conn:
+            conn.execute(
+                "DELETE FROM user_sessions WHERE expires_at < ?",
+                (datetime.utcnow().isoformat(),),
+            )
+            conn.commit()
+    except sqlite3.Error:
+        pass  # transient; the next sweep retries
+
+
+def _start_session_sweeper(interval: float = _SESSION_SWEEP_INTERVAL) -> None:
+    """Run _sweep_expired_sessions every ``interval`` seconds."""
+
+    def loop() -> None:
+        while True:
+            time.sleep(interval)
+            _sweep_expired_sessions()
+
+    threading.Thread(
+        target=loop, name="session-sweeper", daemon=True
+    ).start()
+
 
 def logout_user(session_token: str) -> None:
     """Logout a user by removing their session."""
-    conn = sqlite3.connect(DB_PATH)
-    try:
+    with _session_cache_lock:
+        _session_cache.pop(session_token, None)
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("DELETE FROM user_sessions WHERE session_token = ?", (session_token,))
         conn.commit()
-    finally:
-        conn.close()
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize row objects (e.g. Evaluation) via their as_dict hook."""
+    as_dict = getattr(obj, "as_dict", None)
+    if as_dict is not None:
+        return as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 # ---------------------------------------------------------------------------
 # Request handler
 # ---------------------------------------------------------------------------
 
+# Raw wire bytes for every fixed redirect the auth flows can emit,
+# rendered once at import.  send_redirect then answers these — the
+# common case, and the entirety of a credential-stuffing storm — with a
+# single write instead of four header calls per response.
+_REDIRECT_TARGETS = (
+    "/login",
+    "/login?error=missing_fields",
+    "/login?error=invalid_credentials",
+    "/login?error=server_error",
+    "/login?success=registered",
+    "/register?error=missing_fields",
+    "/register?error=password_mismatch",
+    "/register?error=password_too_short",
+    "/register?error=email_exists",
+    "/register?error=server_error",
+    "/dashboard",
+)
+_RAW_REDIRECTS = {
+    location: (
+        "HTTP/1.1 302 Found\r\n"
+        f"Location: {location}\r\n"
+        "Content-Length: 0\r\n\r\n"
+    ).encode("ascii")
+    for location in _REDIRECT_TARGETS
+}
+
 
 class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
     """Custom request handler for our CVSS web server."""
 
+    # Speak HTTP/1.1 so browsers reuse one connection for the burst of
+    # requests a dashboard load issues, instead of a TCP handshake per
+    # resource.  Keep-alive requires every response to carry an accurate
+    # Content-Length, which the send_* helpers below guarantee.  The
+    # timeout caps how long an idle kept-alive connection pins a thread.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
     def log_message(self, format: str, *args: Any) -> None:
-        """Override to suppress default logging to stderr."""
-        # Print to console with timestamp
-        print(
-            f"[{datetime.utcnow().isoformat()}] {self.address_string()} - "
-            + format % args
-        )
+        """Queue the request log line for the background listener.
+
+        Formatting and the actual stdout write happen off the request
+        thread, so logging never stalls a response.
+        """
+        logger.info("%s - " + format, self.address_string(), *args)
+
+    # Responses below this size rarely shrink enough to repay the gzip
+    # header overhead and the extra CPU.
+    _GZIP_MIN_SIZE = 1024
+
+    def _maybe_gzip(self, payload: bytes) -> Tuple[bytes, bool]:
+        """Compress a response body when the client accepts gzip.
 
-    def send_json(self, data: Any, status: int = 200) -> None:
-        """Send a JSON response."""
-        payload = json.dumps(data, indent=2).encode("utf-8")
+        Level 1 keeps the CPU cost low while still collapsing the highly
+        repetitive JSON and HTML bodies several-fold.
+        """
+        if len(payload) < self._GZIP_MIN_SIZE:
+            return payload, False
+        if "gzip" not in self.headers.get("Accept-Encoding", ""):
+            return payload, False
+        return gzip.compress(payload, compresslevel=1), True
+
+    def send_json(self, data: Any, status: int = 200, etag: Optional[str] = None) -> None:
+        """Send a JSON response, optionally tagged with an ETag header.
+
+        Payloads are encoded compactly: machine consumers do not need
+        indentation, and dropping it shrinks the dashboard summary and
+        list responses by a quarter or more.
+        """
+        if orjson is not None:
+            payload = orjson.dumps(data, default=_json_default)
+        else:
+            payload = json.dumps(
+                data, separators=(",", ":"), default=_json_default
+            ).encode("utf-8")
+        payload, gzipped = self._maybe_gzip(payload)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Vary", "Accept-Encoding")
         self.send_header("Content-Length", str(len(payload)))
+        if etag:
+            self.send_header("ETag", etag)
         self.end_headers()
         self.wfile.write(payload)
+
+    def send_not_modified(self, etag: str) -> None:
+        """Send an empty 304 Not Modified response carrying the ETag."""
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.end_headers()
     
     def get_session_token(self) -> Optional[str]:
         """Extract session token from cookies."""
         cookie_header = self.headers.get('Cookie', '')
         if not cookie_header:
             return None
-        
+
+        # partition() splits name and value in one C-level scan, instead
+        # of a startswith() pass followed by a second split() pass.
         for cookie in cookie_header.split(';'):
-            cookie = cookie.strip()
-            if cookie.startswith('session_token='):
-                return cookie.split('=', 1)[1]
+            name, sep, value = cookie.strip().partition('=')
+            if sep and name == 'session_token':
+                return value
         return None
 
     def get_current_user(self) -> Optional[Dict[str, Any]]:
@@ -1614,197 +2330,403 @@ class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
         return user
 
     def send_redirect(self, location: str) -> None:
-        """Send a redirect response."""
+        """Send a redirect response.
+
+        Fixed targets go out as pre-rendered bytes in one write; only
+        dynamic locations pay the per-header path.
+        """
+        raw = _RAW_REDIRECTS.get(location)
+        if raw is not None:
+            self.wfile.write(raw)
+            self.log_request(302)
+            return
         self.send_response(302)
         self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
 
     def do_GET(self) -> None:
-        """Handle GET requests based on the request path."""
+        """Dispatch GET requests through the precompiled route tables."""
         parsed = urllib.parse.urlparse(self.path)
+        handler = GET_ROUTES.get(parsed.path)
+        if handler is not None:
+            handler(self, parsed)
+            return
+        # Parameterized paths: key on everything up to the last slash, so
+        # /api/vulns/<id> resolves with one dict lookup instead of a
+        # regex scan.
         path = parsed.path
-        
-        # Authentication routes (public)
-        if path == "/login":
-            # Check for error/success parameters
-            query_params = urllib.parse.parse_qs(parsed.query)
-            error = query_params.get('error', [None])[0]
-            success = query_params.get('success', [None])[0]
-            
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            login_page = render_login_page(error, success)
-            self.send_header("Content-Length", str(len(login_page)))
-            self.end_headers()
-            self.wfile.write(login_page)
-        elif path == "/register":
-            # Check for error parameters
-            query_params = urllib.parse.parse_qs(parsed.query)
-            error = query_params.get('error', [None])[0]
-            
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            register_page = render_register_page(error)
-            self.send_header("Content-Length", str(len(register_page)))
-            self.end_headers()
-            self.wfile.write(register_page)
-        elif path == "/logout":
-            # Logout user and redirect to login
-            session_token = self.get_session_token()
-            if session_token:
-                logout_user(session_token)
-            self.send_redirect('/login')
-        
-        # Protected routes (require authentication)
-        elif path == "/" or path == "/evaluate":
-            user = self.require_auth()
-            if not user:
-                return
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            form = render_form(user)
-            self.send_header("Content-Length", str(len(form)))
-            self.end_headers()
-            self.wfile.write(form)
-        elif path == "/dashboard":
-            user = self.require_auth()
-            if not user:
-                return
-            
-            # Check if user wants to see only their evaluations
-            query_params = urllib.parse.parse_qs(parsed.query)
-            show_all = query_params.get('show_all', ['true'])[0].lower() == 'true'
-            
-            # Show all evaluations or filter by user based on parameter
-            if show_all:
-                counts, top_list = summary_counts_and_top(DB_PATH, user_id=None)
-            else:
-                counts, top_list = summary_counts_and_top(DB_PATH, user['user_id'])
-            
-            page = render_dashboard(counts, top_list, user, show_all)
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(page)))
-            self.end_headers()
-            self.wfile.write(page)
-        elif path == "/api/dashboard/summary":
-            counts, top_list = summary_counts_and_top(DB_PATH)
-            # Convert top_list to include only relevant fields (avoid large JSON)
-            top_minimal = [
-                {
-                    "id": rec["id"],
-                    "title": rec["title"],
-                    "cve_id": rec["cve_id"],
-                    "base_score": rec["base_score"],
-                    "severity": rec["severity"],
-                    "created_at": rec["created_at"],
-                }
-                for rec in top_list
-            ]
-            self.send_json({"counts": counts, "top": top_minimal})
-        elif path == "/api/vulns":
-            # If there is an id parameter, return that record
-            query_params = urllib.parse.parse_qs(parsed.query)
-            if "id" in query_params:
-                try:
-                    eval_id = int(query_params["id"][0])
-                except ValueError:
-                    self.send_json({"error": "Invalid id"}, status=400)
-                    return
-                record = fetch_evaluation_by_id(DB_PATH, eval_id)
-                if record:
-                    self.send_json(record)
-                else:
-                    self.send_json({"error": "Not found"}, status=404)
-            else:
-                # Return all evaluations
-                evals = fetch_evaluations(DB_PATH)
-                self.send_json(evals)
-        elif path.startswith("/api/vulns/"):
-            # Path param variant: /api/vulns/<id>
+        prefix = path[: path.rfind("/") + 1]
+        prefix_handler = GET_PREFIX_ROUTES.get(prefix)
+        if prefix_handler is not None:
+            prefix_handler(self, parsed, path[len(prefix):])
+            return
+        self.serve_not_found(parsed)
+
+    def do_POST(self) -> None:
+        """Dispatch POST requests through the precompiled route table."""
+        parsed = urllib.parse.urlparse(self.path)
+        handler = POST_ROUTES.get(parsed.path)
+        if handler is not None:
+            handler(self, parsed)
+            return
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def send_html(self, page: bytes) -> None:
+        """Send a complete HTML page with the appropriate headers."""
+        page, gzipped = self._maybe_gzip(page)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    # -- GET route handlers -------------------------------------------------
+
+    def serve_login_page(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the login page, surfacing error/success query parameters."""
+        if not parsed.query:
+            self.send_html(_LOGIN_PAGE_DEFAULT)
+            return
+        query_params = urllib.parse.parse_qs(parsed.query)
+        error = query_params.get('error', [None])[0]
+        success = query_params.get('success', [None])[0]
+        self.send_html(render_login_page(error, success))
+
+    def serve_register_page(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the registration page, surfacing error query parameters."""
+        if not parsed.query:
+            self.send_html(_REGISTER_PAGE_DEFAULT)
+            return
+        query_params = urllib.parse.parse_qs(parsed.query)
+        error = query_params.get('error', [None])[0]
+        self.send_html(render_register_page(error))
+
+    def serve_logout(self, parsed: urllib.parse.ParseResult) -> None:
+        """Log the user out and redirect to the login page."""
+        session_token = self.get_session_token()
+        if session_token:
+            logout_user(session_token)
+        self.send_redirect('/login')
+
+    def serve_form(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the evaluation form (requires authentication)."""
+        user = self.require_auth()
+        if not user:
+            return
+        self.send_html(render_form(user))
+
+    def serve_dashboard(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the dashboard page (requires authentication)."""
+        user = self.require_auth()
+        if not user:
+            return
+
+        # Check if user wants to see only their evaluations
+        query_params = urllib.parse.parse_qs(parsed.query)
+        show_all = query_params.get('show_all', ['true'])[0].lower() == 'true'
+
+        # Show all evaluations or filter by user based on parameter
+        if show_all:
+            counts, top_list = summary_counts_and_top(user_id=None)
+        else:
+            counts, top_list = summary_counts_and_top(user['user_id'])
+
+        self.send_html(render_dashboard(counts, top_list, user, show_all))
+
+    def serve_api_summary(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the JSON dashboard summary."""
+        # Answer "no new data" polls without rebuilding the summary.
+        etag = _vulns_etag()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_not_modified(etag)
+            return
+        counts, top_list = summary_counts_and_top()
+        # Ship the top list column-oriented: the field names go over the
+        # wire once instead of being repeated in every row, and the rows
+        # stay lists sliced straight from the cached tuples — no dict
+        # allocation per row.
+        self.send_json(
+            {
+                "counts": counts,
+                "top": {
+                    "columns": list(_TOP_API_COLUMNS),
+                    "rows": [_top_api_row(rec) for rec in top_list],
+                },
+            },
+            etag=etag,
+        )
+
+    def serve_api_vulns(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the evaluation list, or a single record via ?id=N."""
+        # Answer "no new data" polls without refetching every record.
+        etag = _vulns_etag()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_not_modified(etag)
+            return
+        # If there is an id parameter, return that record
+        query_params = urllib.parse.parse_qs(parsed.query)
+        if "id" in query_params:
             try:
-                eval_id = int(path.split("/")[3])
-            except (IndexError, ValueError):
-                self.send_json({"error": "Invalid path"}, status=400)
+                eval_id = int(query_params["id"][0])
+            except ValueError:
+                self.send_json({"error": "Invalid id"}, status=400)
                 return
-            record = fetch_evaluation_by_id(DB_PATH, eval_id)
+            record = fetch_evaluation_by_id(eval_id)
             if record:
                 self.send_json(record)
             else:
                 self.send_json({"error": "Not found"}, status=404)
-        elif path == "/api/export/csv":
-            # Export all evaluations as CSV
-            evals = fetch_evaluations(DB_PATH)
-            # Build CSV header and rows
-            header = [
-                "id",
-                "title",
-                "cve_id",
-                "source",
-                "metrics_json",
-                "vector",
-                "base_score",
-                "severity",
-                "created_at",
-            ]
-            lines = ["\t".join(header)]
-            for rec in evals:
-                row = [str(rec[h] or "") for h in header]
-                lines.append("\t".join(row))
-            csv_data = "\n".join(lines).encode("utf-8")
-            self.send_response(200)
-            self.send_header(
-                "Content-Type", "text/tab-separated-values; charset=utf-8"
-            )
-            self.send_header(
-                "Content-Disposition", "attachment; filename=evaluations.tsv"
-            )
-            self.send_header("Content-Length", str(len(csv_data)))
-            self.end_headers()
-            self.wfile.write(csv_data)
         else:
-            # Not found
-            self.send_response(404)
-            self.send_header("Content-Type", "text/plain; charset=utf-8")
-            msg = f"404 Not Found: {path}".encode("utf-8")
-            self.send_header("Content-Length", str(len(msg)))
-            self.end_headers()
-            self.wfile.write(msg)
+            # Return all evaluations
+            evals = fetch_evaluations()
+            self.send_json(evals, etag=etag)
 
-    def do_POST(self) -> None:
-        """Handle POST requests (form submissions)."""
-        parsed = urllib.parse.urlparse(self.path)
-        path = parsed.path
-        
-        # Handle authentication routes
-        if path == "/login":
-            self.handle_login()
+    def serve_api_vulns_batch(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve many evaluations in one response.
+
+        Accepts ``{"ids": [...]}`` and returns the matching records as a
+        single JSON array in request order, amortizing the per-request
+        dispatch, connection borrow, and serialization that N separate
+        /api/vulns/<id> calls would each pay.
+        """
+        try:
+            payload = json.loads(self._read_body() or b"{}")
+            raw_ids = payload.get("ids", [])
+            # Require an actual list: a string here would silently be
+            # iterated character by character into bogus ids.
+            if not isinstance(raw_ids, list):
+                raise TypeError("ids must be a list")
+            ids = [int(eval_id) for eval_id in raw_ids]
+        except (AttributeError, ValueError, TypeError, json.JSONDecodeError):
+            self.send_json({"error": "Invalid ids"}, status=400)
             return
-        elif path == "/register":
-            self.handle_register()
+        self.send_json(fetch_evaluations_by_ids(ids))
+
+    def serve_api_vulns_batch_insert(
+        self, parsed: urllib.parse.ParseResult
+    ) -> None:
+        """Score and store many evaluations in one transaction.
+
+        Accepts ``{"evaluations": [{"title": ..., "cve_id": ...,
+        "source": ..., "metrics": {...}}, ...]}`` and inserts every row
+        inside a single transaction, so a bulk import pays one commit
+        instead of one per evaluation.
+        """
+        user = self.get_current_user()
+        if not user:
+            self.send_json({"error": "Authentication required"}, status=401)
             return
-        elif path == "/evaluate":
-            # Require authentication for evaluation
-            user = self.require_auth()
-            if not user:
-                return
-            self.handle_evaluation(user)
+        try:
+            payload = json.loads(self._read_body() or b"{}")
+            items = payload.get("evaluations", [])
+            rows = []
+            for item in items:
+                metrics = {
+                    k: str(v) for k, v in item.get("metrics", {}).items()
+                }
+                base_score, severity, vector = calculate_base_score(metrics)
+                rows.append(
+                    (
+                        item.get("title", ""),
+                        item.get("cve_id", ""),
+                        item.get("source", ""),
+                        metrics,
+                        vector,
+                        base_score,
+                        severity,
+                    )
+                )
+        except (AttributeError, TypeError, ValueError, json.JSONDecodeError):
+            self.send_json({"error": "Invalid evaluations"}, status=400)
+            return
+        ids = insert_evaluations_bulk(rows, user_id=user["user_id"])
+        self.send_json({"ids": ids, "count": len(ids)}, status=201)
+
+    def serve_api_dashboard_bundle(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve counts, top list, and the current user in one response.
+
+        Collapses the separate summary fetch and session lookup a
+        dashboard load performs into a single request.
+        """
+        etag = _vulns_etag()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_not_modified(etag)
             return
+        user = self.get_current_user()
+        counts, top_list = summary_counts_and_top()
+        top = [dict(zip(TOP_COLUMNS, row)) for row in top_list]
+        self.send_json({"counts": counts, "top": top, "user": user}, etag=etag)
+
+    def serve_api_vuln_detail(
+        self, parsed: urllib.parse.ParseResult, suffix: str
+    ) -> None:
+        """Serve a single evaluation addressed as /api/vulns/<id>."""
+        try:
+            eval_id = int(suffix)
+        except ValueError:
+            self.send_json({"error": "Invalid path"}, status=400)
+            return
+        record = fetch_evaluation_by_id(eval_id)
+        if record:
+            self.send_json(record)
+        else:
+            self.send_json({"error": "Not found"}, status=404)
+
+    def serve_export_csv(self, parsed: urllib.parse.ParseResult) -> None:
+        """Export all evaluations as a tab-separated file.
+
+        Rows are streamed straight off a server-side cursor using chunked
+        transfer encoding, coalesced into ~64 KiB frames: memory stays
+        flat however large the table grows, the download starts before
+        the last row is formatted, and the socket still sees large writes
+        rather than one syscall per row.  Pre-1.1 clients cannot parse
+        chunked framing, so for them the same stream goes out raw,
+        delimited by closing the connection.
+        """
+        chunked = self.request_version >= "HTTP/1.1"
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", "text/tab-separated-values; charset=utf-8"
+        )
+        self.send_header(
+            "Content-Disposition", "attachment; filename=evaluations.tsv"
+        )
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.close_connection = True
+        self.end_headers()
+
+        if chunked:
+            def write_frame(chunk: bytes) -> None:
+                self.wfile.write(b"%X\r\n%s\r\n" % (len(chunk), chunk))
         else:
-            self.send_response(404)
-            self.end_headers()
+            write_frame = self.wfile.write
+
+        buf = ["\t".join(_EXPORT_COLUMNS)]
+        size = len(buf[0])
+        with get_conn() as conn:
+            cur = conn.execute(
+                "SELECT id, title, cve_id, source, metrics_json, vector,"
+                " base_score, severity, created_at FROM evaluations"
+                " ORDER BY created_at DESC"
+            )
+            for row in cur:
+                line = "\t".join("" if v is None else str(v) for v in row)
+                buf.append(line)
+                size += len(line) + 1
+                if size >= 65536:
+                    write_frame(("\n".join(buf) + "\n").encode("utf-8"))
+                    buf = []
+                    size = 0
+        if buf:
+            write_frame("\n".join(buf).encode("utf-8"))
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def serve_example_document(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the static example vulnerability report as a download.
+
+        On platforms with os.sendfile the body is copied kernel-side from
+        the backing file straight to the socket; elsewhere it falls back
+        to a regular write of the in-memory constant.
+        """
+        if self.headers.get("If-None-Match") == _EXAMPLE_DOC_ETAG:
+            self.send_not_modified(_EXAMPLE_DOC_ETAG)
             return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header(
+            "Content-Disposition", "attachment; filename=cvss_example.txt"
+        )
+        self.send_header("Content-Length", str(len(_EXAMPLE_DOC_BYTES)))
+        self.send_header("ETag", _EXAMPLE_DOC_ETAG)
+        self.end_headers()
+        if hasattr(os, "sendfile"):
+            source = _example_doc_file()
+            self.wfile.flush()
+            offset = 0
+            size = len(_EXAMPLE_DOC_BYTES)
+            try:
+                while offset < size:
+                    sent = os.sendfile(
+                        self.connection.fileno(), source.fileno(),
+                        offset, size - offset,
+                    )
+                    if not sent:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                if offset:
+                    raise  # partially sent; cannot fall back cleanly
+        self.wfile.write(_EXAMPLE_DOC_BYTES)
+
+    def _serve_static_asset(self, payload: bytes, etag: str, content_type: str) -> None:
+        """Serve a precomputed static asset with an aggressive cache policy.
+
+        The assets never change within a running process, so browsers may
+        cache them for a year; a redeploy changes the ETag, which
+        If-None-Match revalidation picks up.
+        """
+        if self.headers.get("If-None-Match") == etag:
+            self.send_not_modified(etag)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def serve_app_css(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the shared stylesheet."""
+        self._serve_static_asset(
+            _APP_CSS_BYTES, _APP_CSS_ETAG, "text/css; charset=utf-8"
+        )
+
+    def serve_app_js(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve the shared page script."""
+        self._serve_static_asset(
+            _APP_JS_BYTES, _APP_JS_ETAG, "application/javascript; charset=utf-8"
+        )
+
+    def serve_not_found(self, parsed: urllib.parse.ParseResult) -> None:
+        """Serve a plain-text 404 response."""
+        self.send_response(404)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        msg = f"404 Not Found: {parsed.path}".encode("utf-8")
+        self.send_header("Content-Length", str(len(msg)))
+        self.end_headers()
+        self.wfile.write(msg)
+
+    # -- POST route handlers ------------------------------------------------
 
-    def handle_login(self) -> None:
+    def serve_evaluate_post(self, parsed: urllib.parse.ParseResult) -> None:
+        """Handle an evaluation submission (requires authentication)."""
+        user = self.require_auth()
+        if not user:
+            return
+        self.handle_evaluation(user)
+
+
+    def handle_login(self, parsed: urllib.parse.ParseResult) -> None:
         """Handle user login."""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            form_data = urllib.parse.parse_qs(post_data.decode('utf-8'))
-            
-            email = form_data.get('email', [''])[0]
-            password = form_data.get('password', [''])[0]
+            form_data = dict(urllib.parse.parse_qsl(
+                self._read_body().decode('utf-8'), keep_blank_values=True
+            ))
+
+            email = form_data.get('email', '')
+            password = form_data.get('password', '')
             
             if not email or not password:
                 self.send_redirect('/login?error=missing_fields')
@@ -1818,6 +2740,7 @@ class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
                 self.send_response(302)
                 self.send_header('Set-Cookie', f'session_token={session_token}; HttpOnly; Path=/; Max-Age=604800')
                 self.send_header('Location', '/dashboard')
+                self.send_header('Content-Length', '0')
                 self.end_headers()
             else:
                 self.send_redirect('/login?error=invalid_credentials')
@@ -1826,17 +2749,17 @@ class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
             print(f"Login error: {e}")
             self.send_redirect('/login?error=server_error')
 
-    def handle_register(self) -> None:
+    def handle_register(self, parsed: urllib.parse.ParseResult) -> None:
         """Handle user registration."""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            form_data = urllib.parse.parse_qs(post_data.decode('utf-8'))
-            
-            full_name = form_data.get('full_name', [''])[0]
-            email = form_data.get('email', [''])[0]
-            password = form_data.get('password', [''])[0]
-            confirm_password = form_data.get('confirm_password', [''])[0]
+            form_data = dict(urllib.parse.parse_qsl(
+                self._read_body().decode('utf-8'), keep_blank_values=True
+            ))
+
+            full_name = form_data.get('full_name', '')
+            email = form_data.get('email', '')
+            password = form_data.get('password', '')
+            confirm_password = form_data.get('confirm_password', '')
             
             if not all([full_name, email, password, confirm_password]):
                 self.send_redirect('/register?error=missing_fields')
@@ -1862,82 +2785,92 @@ class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
             print(f"Registration error: {e}")
             self.send_redirect('/register?error=server_error')
 
+    def _read_body(self) -> bytes:
+        """Read the request body in bounded 64 KiB chunks.
+
+        ``rfile.read(content_length)`` with a multi-megabyte length asks
+        for one giant allocation up front; chunked reads keep the peak at
+        body-size plus one buffer, overlap network I/O with assembly, and
+        tolerate short reads from slow clients.
+        """
+        remaining = int(self.headers.get("Content-Length", 0))
+        chunks = []
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def _parse_multipart(
+        self, content_type: str, body: bytes
+    ) -> Tuple[Dict[str, str], Optional[bytes], Optional[str]]:
+        """Parse a multipart/form-data body with the stdlib MIME parser.
+
+        The body is fed to a BytesFeedParser in 64 KiB slices under a
+        synthesized Content-Type header, so the parser makes one linear
+        pass instead of splitting the whole payload on the boundary and
+        rescanning every part with find/rfind.  Returns the plain form
+        fields plus the uploaded file's content and name, if any.
+        """
+        parser = email.parser.BytesFeedParser()
+        parser.feed(b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n")
+        for start in range(0, len(body), 65536):
+            parser.feed(body[start:start + 65536])
+        msg = parser.close()
+
+        form_data: Dict[str, str] = {}
+        uploaded_file = None
+        filename = None
+        for part in msg.walk():
+            if part.get_content_maintype() == "multipart":
+                continue
+            name = part.get_param("name", header="content-disposition")
+            if not name:
+                continue
+            payload = part.get_payload(decode=True) or b""
+            part_filename = part.get_filename()
+            if part_filename:
+                filename = part_filename
+                uploaded_file = payload
+            else:
+                form_data[name] = payload.decode("utf-8", "replace")
+        return form_data, uploaded_file, filename
+
     def handle_evaluation(self, user: Dict[str, Any]) -> None:
         """Handle CVSS evaluation with authentication."""
         # Check if this is a multipart form (file upload)
         content_type = self.headers.get("Content-Type", "")
         document_analysis = None
-        
+        # Read the body exactly once, up front: retrying the read after a
+        # parse failure would block on an already-drained socket.
+        post_data = self._read_body()
+
         if "multipart/form-data" in content_type:
             # Handle file upload
             try:
-                # Parse multipart form data
-                content_length = int(self.headers.get("Content-Length", 0))
-                post_data = self.rfile.read(content_length)
-                
-                # Parse multipart data manually (simplified)
-                boundary = content_type.split("boundary=")[1]
-                parts = post_data.split(b"--" + boundary.encode())
-                
-                form_data = {}
-                uploaded_file = None
-                filename = None
-                
-                for part in parts:
-                    if b"Content-Disposition: form-data" in part:
-                        # Extract field name and value
-                        if b'name="' in part:
-                            name_start = part.find(b'name="') + 6
-                            name_end = part.find(b'"', name_start)
-                            field_name = part[name_start:name_end].decode()
-                            
-                            # Check if it's a file field
-                            if b'filename="' in part:
-                                # This is a file upload
-                                filename_start = part.find(b'filename="') + 10
-                                filename_end = part.find(b'"', filename_start)
-                                filename = part[filename_start:filename_end].decode()
-                                
-                                # Extract file content
-                                content_start = part.find(b'\r\n\r\n') + 4
-                                content_end = part.rfind(b'\r\n')
-                                if content_end > content_start:
-                                    file_content = part[content_start:content_end]
-                                    uploaded_file = file_content
-                            else:
-                                # This is a regular form field
-                                value_start = part.find(b'\r\n\r\n') + 4
-                                value_end = part.rfind(b'\r\n')
-                                if value_end > value_start:
-                                    field_value = part[value_start:value_end].decode()
-                                    form_data[field_name] = field_value
-                
+                form_data, uploaded_file, filename = self._parse_multipart(
+                    content_type, post_data
+                )
+
                 # Process uploaded document if present
-                if uploaded_file and filename and document_processor:
+                if uploaded_file and filename and _DOC_PROCESSOR_AVAILABLE:
                     try:
-                        document_analysis = document_processor.process_document(uploaded_file, filename)
+                        document_analysis = _process_document(uploaded_file, filename)
                         if document_analysis.get('success'):
-                            # Pre-fill form with detected values
+                            # Detected values always win over whatever the
+                            # form carried alongside the upload.
                             detected_metrics = document_analysis['metrics']
-                            print(f"🔍 DEBUG - Document metrics detected: {detected_metrics}")
-                            
-                            for key in ["AV", "AC", "PR", "UI", "S", "C", "I", "A"]:
-                                # Always use detected values if available, regardless of form_data
+                            for key in METRIC_KEYS:
                                 if key in detected_metrics:
                                     form_data[key] = detected_metrics[key]
-                                    print(f"✅ DEBUG - Set {key} = {detected_metrics[key]}")
-                                else:
-                                    print(f"❌ DEBUG - No detection for {key}")
-                            
-                            print(f"🔍 DEBUG - Final form_data: {form_data}")
-                            
                             # Pre-fill other fields
                             if document_analysis.get('title'):
                                 form_data['title'] = document_analysis['title']
                             if document_analysis.get('cve_id'):
                                 form_data['cve_id'] = document_analysis['cve_id']
                     except Exception as e:
-                        print(f"❌ DEBUG - Error processing document: {e}")
                         document_analysis = {
                             'success': False,
                             'error': str(e),
@@ -1946,35 +2879,28 @@ class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
                 
             except Exception as e:
                 # Fallback to regular form processing
-                content_length = int(self.headers.get("Content-Length", 0))
-                post_data = self.rfile.read(content_length)
-                form_data = urllib.parse.parse_qs(post_data.decode("utf-8"))
+                form_data = dict(urllib.parse.parse_qsl(
+                    post_data.decode("utf-8"), keep_blank_values=True
+                ))
         else:
             # Regular form data (no file upload)
-            content_length = int(self.headers.get("Content-Length", 0))
-            post_data = self.rfile.read(content_length)
-            form_data = urllib.parse.parse_qs(post_data.decode("utf-8"))
-
-        def get_value(key: str) -> str:
-            return form_data.get(key, [""])[0]
-
-        # Extract metrics and metadata
-        metrics = {}
-        for key in ["AV", "AC", "PR", "UI", "S", "C", "I", "A"]:
-            metrics[key] = get_value(key)
-            print(f"🔍 DEBUG - Final metric {key}: {metrics[key]}")
-        
-        title = get_value("title").strip()
-        cve_id = get_value("cve_id").strip()
-        source = get_value("source").strip()
-        
-        print(f"🔍 DEBUG - Final metrics for calculation: {metrics}")
+            form_data = dict(urllib.parse.parse_qsl(
+                post_data.decode("utf-8"), keep_blank_values=True
+            ))
+
+        # Extract metrics and metadata.  parse_qsl yields flat
+        # name/value pairs, so form_data matches the multipart dict
+        # shape and values are plain strings throughout.
+        metrics = {key: form_data.get(key, "") for key in METRIC_KEYS}
+        title = form_data.get("title", "").strip()
+        cve_id = form_data.get("cve_id", "").strip()
+        source = form_data.get("source", "").strip()
 
         # Compute base score
         base_score, severity, vector = calculate_base_score(metrics)
         # Persist record
         eval_id = insert_evaluation(
-            DB_PATH, title, cve_id, source, metrics, vector, base_score, severity, user['user_id']
+            title, cve_id, source, metrics, vector, base_score, severity, user['user_id']
         )
         # Return result page
         result_page = render_result(
@@ -1988,11 +2914,47 @@ class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
             document_analysis,
             user
         )
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(result_page)))
-        self.end_headers()
-        self.wfile.write(result_page)
+        self.send_html(result_page)
+
+
+# ---------------------------------------------------------------------------
+# Route tables
+# ---------------------------------------------------------------------------
+
+# Precompiled dispatch tables keyed by exact path.  do_GET/do_POST look the
+# handler up in O(1) instead of walking an if/elif chain of string
+# comparisons on every request.  Parameterized paths resolve through a
+# prefix map keyed on the path up to the last slash.
+
+GET_ROUTES: Dict[str, Callable[[CVSSRequestHandler, urllib.parse.ParseResult], None]] = {
+    "/login": CVSSRequestHandler.serve_login_page,
+    "/register": CVSSRequestHandler.serve_register_page,
+    "/logout": CVSSRequestHandler.serve_logout,
+    "/": CVSSRequestHandler.serve_form,
+    "/evaluate": CVSSRequestHandler.serve_form,
+    "/dashboard": CVSSRequestHandler.serve_dashboard,
+    "/api/dashboard/summary": CVSSRequestHandler.serve_api_summary,
+    "/api/dashboard/bundle": CVSSRequestHandler.serve_api_dashboard_bundle,
+    "/api/vulns": CVSSRequestHandler.serve_api_vulns,
+    "/api/export/csv": CVSSRequestHandler.serve_export_csv,
+    "/download-example": CVSSRequestHandler.serve_example_document,
+    "/static/app.css": CVSSRequestHandler.serve_app_css,
+    "/static/app.js": CVSSRequestHandler.serve_app_js,
+}
+
+# Parameterized GET routes keyed by the path up to and including the last
+# slash; the handler receives the remaining path segment.
+GET_PREFIX_ROUTES: Dict[str, Callable[..., None]] = {
+    "/api/vulns/": CVSSRequestHandler.serve_api_vuln_detail,
+}
+
+POST_ROUTES: Dict[str, Callable[[CVSSRequestHandler, urllib.parse.ParseResult], None]] = {
+    "/login": CVSSRequestHandler.handle_login,
+    "/register": CVSSRequestHandler.handle_register,
+    "/evaluate": CVSSRequestHandler.serve_evaluate_post,
+    "/api/vulns:batch": CVSSRequestHandler.serve_api_vulns_batch,
+    "/api/vulns:batch_insert": CVSSRequestHandler.serve_api_vulns_batch_insert,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -2000,13 +2962,47 @@ class CVSSRequestHandler(http.server.BaseHTTPRequestHandler):
 # ---------------------------------------------------------------------------
 
 
+class CVSSHTTPServer(http.server.ThreadingHTTPServer):
+    """Threading server tuned for concurrent clients.
+
+    Concurrency is bounded by a semaphore sized to match the database
+    connection pool: a connection flood waits in the accept loop (and
+    the kernel listen backlog) instead of spawning an unbounded number
+    of OS threads, and a thread beyond that count would only block
+    waiting for a database connection anyway.  The threads themselves
+    stay ThreadingMixIn's daemon threads, so idle keep-alive
+    connections cannot keep the process alive past shutdown.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connection_slots = threading.BoundedSemaphore(_POOL_SIZE)
+
+    def process_request(self, request, client_address):
+        self._connection_slots.acquire()
+        super().process_request(request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._connection_slots.release()
+
+
 def run_server(host: str = HOST, port: int = PORT) -> None:
     """Initialise the database and run the HTTP server indefinitely."""
     # Ensure database directory exists
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     init_db(DB_PATH)
+    _start_parse_pool()
+    _start_session_sweeper()
+    # Materialize the example-document backing file now so the first
+    # /download-example request does not pay the tempfile setup.
+    _example_doc_file()
     server_address = (host, port)
-    with http.server.ThreadingHTTPServer(server_address, CVSSRequestHandler) as httpd:
+    with CVSSHTTPServer(server_address, CVSSRequestHandler) as httpd:
         print(f"Serving CVSS app at http://{host}:{port}/")
         try:
             httpd.serve_forever()
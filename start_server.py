@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+CVSS Server Launcher
+====================
+
+Convenience entry point for local use: checks that the application
+files are present, prints a short banner with the relevant URLs, opens
+the evaluation form in the default browser, and starts the server.
+
+The plain ``python server.py`` path documented in the README keeps
+working; this script only adds the niceties around it.
+"""
+
+import os
+import sys
+import threading
+
+URL = "http://localhost:8000"
+
+# Files the launcher requires in the working directory.
+_REQUIRED_FILES = ('server.py', 'cvss.py')
+
+# Stamp file recording that the dependency check passed.  Supervisors
+# that respawn the process (systemd, --reload watchers) re-run the same
+# check every time; when the stamp is newer than every required file the
+# stat loop is skipped entirely.  It lives next to server.py rather than
+# in the shared temp directory, so checkouts (and users) never contend
+# over one predictable /tmp path.
+_DEPS_STAMP = ".cvss_deps.ok"
+
+
+# Startup text, built once at import as named constants so the strings
+# exist as single cached objects (also across module reloads) and the
+# whole block goes out in one write: a dozen separate print() calls each
+# take the stdout lock, encode, and — on a line-buffered TTY — flush
+# individually.
+_BANNER = """
+╔══════════════════════════════════════════════╗
+║              CVSS Server v1.0                ║
+║   CVSS v3.1 Vulnerability Scoring System     ║
+╚══════════════════════════════════════════════╝
+"""
+
+_SERVER_INFO = f"""
+📋 Server Information:
+   • URL:       {URL}
+   • Dashboard: {URL}/dashboard
+   • API:       {URL}/api/vulns
+"""
+
+_TIPS = """
+💡 Tips:
+   • Press Ctrl+C to stop the server
+   • The SQLite database is created next to server.py
+   • Run with --precompile after installing to warm the bytecode cache
+
+"""
+
+_STARTUP_TEXT = _BANNER + _SERVER_INFO + _TIPS
+
+
+def print_banner():
+    """Print just the banner (the launcher itself writes _STARTUP_TEXT)."""
+    print(_BANNER)
+
+
+def check_dependencies():
+    """Check that the application modules are present in the CWD.
+
+    A passing result is stamped next to server.py; on warm restarts the
+    stamp's mtime is compared against every required file with one
+    os.stat each, skipping the directory scan.  A missing file raises
+    OSError out of the comparison, so deletions invalidate the stamp.
+    """
+    try:
+        stamp_mtime = os.stat(_DEPS_STAMP).st_mtime
+        if all(os.stat(file).st_mtime <= stamp_mtime for file in _REQUIRED_FILES):
+            return True
+    except OSError:
+        pass  # no stamp yet, or a file is missing: run the full check
+    # One directory read covers every required file, instead of a stat
+    # syscall per file — and stays a single read as the list grows.
+    entries = {entry.name for entry in os.scandir('.')}
+    missing_files = [file for file in _REQUIRED_FILES if file not in entries]
+    if missing_files:
+        print(f"❌ Missing required files: {', '.join(missing_files)}")
+        print("   Run this script from the repository root.")
+        return False
+    try:
+        with open(_DEPS_STAMP, 'w'):
+            pass  # (re)create the stamp with a fresh mtime
+    except OSError:
+        pass  # read-only checkout: every start just runs the full check
+    return True
+
+
+def _open_browser_now():
+    """Open the evaluation form in the default browser.
+
+    webbrowser is imported here rather than at module top: its import
+    probes $BROWSER and candidate executables, which is wasted work on
+    headless starts and on the failed-dependency exit path.
+    """
+    import webbrowser
+    try:
+        webbrowser.open(URL)
+        print(f"🌐 Opened {URL} in your browser")
+    except Exception:
+        print(f"⚠️  Could not open a browser; visit {URL} manually")
+
+
+def open_browser():
+    """Schedule the browser to open shortly, without blocking.
+
+    A daemon Timer fires after the server has had time to bind its
+    port; the caller proceeds to run_server immediately instead of
+    sitting in a sleep.
+    """
+    timer = threading.Timer(2.0, _open_browser_now)
+    timer.daemon = True
+    timer.start()
+
+
+def main():
+    """Run the launcher.
+
+    With ``--quiet`` (or ``CVSS_QUIET=1`` in the environment) the banner
+    and the browser auto-open are skipped entirely — under a supervisor
+    or in a container both are wasted work, and skipping the opener also
+    drops its two-second delay thread.
+    """
+    if "--precompile" in sys.argv:
+        # Warm the bytecode cache once (e.g. from an install step or a
+        # container build) so the first real start skips the .py → .pyc
+        # compile of the hot modules.
+        import compileall
+        for file in ('server.py', 'cvss.py', 'document_processor.py'):
+            compileall.compile_file(file, quiet=1)
+        sys.exit(0)
+
+    # CVSS_QUIET=0 (or empty) must mean "not quiet" — supervisors set
+    # explicit 0/1 values, so only a real truthy value enables it.
+    quiet = (
+        os.environ.get("CVSS_QUIET", "") not in ("", "0")
+        or "--quiet" in sys.argv
+    )
+    if not check_dependencies():
+        sys.exit(1)
+    if quiet:
+        # Replace the launcher process outright: the server then runs
+        # without the launcher's frame, constants, and imports resident
+        # for its whole lifetime.  run_server handles KeyboardInterrupt
+        # itself, so nothing is lost by dropping the launcher's handler.
+        os.execv(
+            sys.executable,
+            [sys.executable, "-c", "from server import run_server; run_server()"],
+        )
+    sys.stdout.write(_STARTUP_TEXT)
+    sys.stdout.flush()
+
+    # Schedule the browser before paying for server's import, so the
+    # timer delay overlaps the import; run_server stays on the main
+    # thread for clean Ctrl+C.
+    open_browser()
+    from server import run_server
+    try:
+        run_server()
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()